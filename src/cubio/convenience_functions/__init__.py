@@ -1,9 +1,11 @@
 from .envi_file_interface import (
     read_spectral_envi_file_context,
     read_measurement_envi_file_context,
+    read_measurement_set,
 )
 
 __all__ = [
     "read_spectral_envi_file_context",
     "read_measurement_envi_file_context",
+    "read_measurement_set",
 ]
@@ -1,21 +1,50 @@
 # Built-Ins
 from pathlib import Path
+from typing import TypedDict
 from uuid import uuid4
 
 # Dependencies
 import rasterio as rio  # type: ignore
 
 # Local Imports
-from cubio.types import RasterioProfile, NumpyDType
+from cubio.types import RasterioProfile, NumpyDType, CubeArrayFormat
 from cubio.cube_context import CubeContext, ContextBuilder
 from cubio.geotools.models import GeotransformModel
 from cubio.data.crs_wkt_strings import GeographicCRS
-from cubio.envi_hdr_tools import (
-    extract_hdr_wavelengths,
-    extract_hdr_bbl,
-    extract_hdr_band_names,
-    extract_hdr_desc,
-)
+from cubio.envi_hdr_tools import read_hdr_fields
+
+
+class _SharedContext(TypedDict):
+    data_filename: Path
+    nrows: int
+    ncols: int
+    nbands: int
+    crs: str
+    geotransform: GeotransformModel
+    hdr_off: int
+    interleave: CubeArrayFormat
+    nodata: float | int
+
+
+def _shared_base(fp: Path | str, prf: RasterioProfile) -> _SharedContext:
+    """Context fields that are read the same way for every ENVI file."""
+    crs: str
+    if prf["crs"] is None:
+        crs = GeographicCRS.GCS_MOON_2000
+    else:
+        crs = str(prf["crs"])
+
+    return {
+        "data_filename": Path(Path(fp).name),
+        "nrows": prf["height"],
+        "ncols": prf["width"],
+        "nbands": prf["count"],
+        "crs": crs,
+        "geotransform": GeotransformModel.fromaffine(prf["transform"]),
+        "hdr_off": 0,
+        "interleave": "BIL",
+        "nodata": -999,
+    }
 
 
 def read_spectral_envi_file_context(fp: Path | str, name: str) -> CubeContext:
@@ -44,9 +73,10 @@ def read_spectral_envi_file_context(fp: Path | str, name: str) -> CubeContext:
         prf: RasterioProfile = f.profile
 
     hdr_fp = Path(fp).with_suffix(".hdr")
-    wvls = extract_hdr_wavelengths(hdr_fp)
-    desc = extract_hdr_desc(hdr_fp)
-    bbl = extract_hdr_bbl(hdr_fp)
+    hdr = read_hdr_fields(hdr_fp)
+    wvls = hdr["wavelengths"]
+    desc = hdr["description"]
+    bbl = hdr["bbl"]
     if wvls == "Wavelengths not found.":
         raise ValueError(
             "File is not a spectral envi file. Try"
@@ -55,25 +85,12 @@ def read_spectral_envi_file_context(fp: Path | str, name: str) -> CubeContext:
     if bbl == "No BBL Found":
         bbl = [1] * len(wvls)
 
-    if prf["crs"] is None:
-        crs = GeographicCRS.GCS_MOON_2000
-    else:
-        crs = prf["crs"]
-
     context_dict: ContextBuilder = {
+        **_shared_base(fp, prf),
         "name": name,
         "description": desc,
-        "data_filename": Path(Path(fp).name),
-        "nrows": prf["height"],
-        "ncols": prf["width"],
-        "nbands": prf["count"],
-        "crs": str(crs),
-        "geotransform": GeotransformModel.fromaffine(prf["transform"]),
-        "hdr_off": 0,
         "data_type": NumpyDType.FLOAT32,
-        "interleave": "BIL",
-        "nodata": -999,
-        "band_names": [f"Band{n+1}({i}nm)" for n, i in enumerate(wvls)],
+        "band_names": [f"Band{n}({i}nm)" for n, i in enumerate(wvls, 1)],
         "measurement_name": "Wavelength",
         "measurement_units": "nm",
         "measurement_values": wvls,
@@ -109,31 +126,20 @@ def read_measurement_envi_file_context(
         prf: RasterioProfile = f.profile
 
     hdr_fp = Path(fp).with_suffix(".hdr")
-    band_names = extract_hdr_band_names(hdr_fp)
-    bbl = extract_hdr_bbl(hdr_fp)
-    desc = extract_hdr_desc(hdr_fp)
+    hdr = read_hdr_fields(hdr_fp)
+    band_names = hdr["band_names"]
+    bbl = hdr["bbl"]
+    desc = hdr["description"]
+    if band_names == "Band names not found.":
+        raise ValueError("Invalid .HDR format: Cannot find band names.")
     if bbl == "No BBL Found":
         bbl = [1] * len(band_names)
 
-    crs: str
-    if prf["crs"] is None:
-        crs = GeographicCRS.GCS_MOON_2000
-    else:
-        crs = str(prf["crs"])
-
     context_dict: ContextBuilder = {
+        **_shared_base(fp, prf),
         "name": name,
         "description": desc,
-        "data_filename": Path(Path(fp).name),
-        "nrows": prf["height"],
-        "ncols": prf["width"],
-        "nbands": prf["count"],
-        "crs": crs,
-        "geotransform": GeotransformModel.fromaffine(prf["transform"]),
-        "hdr_off": 0,
         "data_type": NumpyDType(prf["dtype"]),
-        "interleave": "BIL",
-        "nodata": -999,
         "band_names": band_names,
         "measurement_name": name,
         "measurement_units": "unitless",
@@ -143,3 +149,39 @@ def read_measurement_envi_file_context(
     }
 
     return CubeContext.from_builder(context_dict)
+
+
+def read_measurement_set(
+    fps: list[Path | str], names: list[str]
+) -> list[CubeContext]:
+    """
+    Reads the context data from several measurement ENVI files (e.g. the
+    LOC and OBS backplanes of a scene) inside a single GDAL environment.
+
+    Parameters
+    ----------
+    fps : list[Path | str]
+        File paths to the ENVI cubes.
+    names : list[str]
+        Name of each CubeContext object, in the same order as `fps`.
+
+    Returns
+    -------
+    list[CubeContext]
+        Context data of each cube, in the same order as `fps`.
+
+    Raises
+    ------
+    ValueError
+        If `fps` and `names` have different lengths.
+    """
+    if len(fps) != len(names):
+        raise ValueError("Each file path must have exactly one name.")
+
+    # One environment for the whole set, so GDAL's block cache and sidecar
+    # lookups are shared between the reads.
+    with rio.Env(GDAL_CACHEMAX=512, CPL_VSIL_CURL_CHUNK_SIZE=1048576):
+        return [
+            read_measurement_envi_file_context(fp, name)
+            for fp, name in zip(fps, names)
+        ]
@@ -1,21 +1,38 @@
 # Built-ins
-from typing import TypedDict, Literal, NotRequired, Union, overload
+from collections.abc import Mapping
+from functools import cached_property
+from typing import (
+    Annotated,
+    Any,
+    TypedDict,
+    Literal,
+    NotRequired,
+    Union,
+    overload,
+    ClassVar,
+    Final,
+    cast,
+)
 from typing_extensions import Self
 from pathlib import Path
-import shutil
+import os
+import stat
+import sys
+import textwrap
 from uuid import UUID, uuid4
 
 # Dependencies
 import numpy as np
 from pydantic import (
     BaseModel,
-    field_serializer,
+    BeforeValidator,
+    PlainSerializer,
     model_validator,
     Field,
-    field_validator,
     PrivateAttr,
 )
-import rasterio as rio  # type: ignore
+from rasterio.crs import CRS  # type: ignore
+from rasterio.enums import WktVersion  # type: ignore
 import xarray as xr
 import tifffile as tiff
 import dask.array as dsk_array
@@ -27,20 +44,40 @@ from cubio.types import (
     is_valid_cubearrayformat,
     suffix_to_format_map,
     RasterioProfile,
+    dtype_to_hdr_integer,
     ImageSuffix,
     is_valid_image_suffix,
     image_suffix_priority,
+    image_suffixes_by_priority,
+    MemmapAccess,
 )
 from cubio.geotools.models import GeotransformModel
-from cubio.envi_hdr_tools import (
-    replace_hdr_band_names,
-    replace_hdr_description,
-    replace_shape_fields,
-)
+from cubio.envi_hdr_tools import ENVI_HDR_TEMPLATE, envi_map_info
 from cubio.cube_size_tools import CubeSize
+from cubio.memmap_tools import advise_memmap
 from cubio.cube_data import CubeData
 
 
+def _uppercase_interleave(value: str) -> CubeArrayFormat:
+    ustr = value.upper()
+    if is_valid_cubearrayformat(ustr):
+        return ustr
+    else:
+        raise ValueError(f"Invalid interleave: {ustr}")
+
+
+def _lowercase_interleave(value: CubeArrayFormat) -> str:
+    return value.lower()
+
+
+# Stored uppercase, written lowercase (as in ENVI headers).
+Interleave = Annotated[
+    CubeArrayFormat,
+    BeforeValidator(_uppercase_interleave),
+    PlainSerializer(_lowercase_interleave),
+]
+
+
 class ContextBuilder(TypedDict):
     name: str
     description: str
@@ -79,7 +116,7 @@ class CubeContext(BaseModel):
     data_type: NumpyDType = Field(
         ..., description="The data type of the cube."
     )
-    interleave: CubeArrayFormat = Field(
+    interleave: Interleave = Field(
         default="BIP",
         description=(
             "The interleave format of the cube. Either BIL, BIP, or BSQ."
@@ -105,7 +142,8 @@ class CubeContext(BaseModel):
         default_factory=list, description="The measurement values."
     )
     bad_bands: list[int] = Field(
-        default_factory=list, description="List of bad band flags."
+        default_factory=lambda data: [1] * data.get("nbands", 0),
+        description="List of bad band flags. Defaults to all good bands.",
     )
     id: UUID = Field(
         default_factory=uuid4, description="Unique ID of the cube object."
@@ -113,14 +151,36 @@ class CubeContext(BaseModel):
     _retrieval_path: Path | Literal["NoRetrieval"] = PrivateAttr(
         default="NoRetrieval"
     )
+    _SHAPE_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"nrows", "ncols", "nbands", "interleave"}
+    )
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # The writers change the interleave of a context in place, so the
+        # cached shapes are dropped whenever a shape field is set.
+        if name in self._SHAPE_FIELDS:
+            self.__dict__.pop("shape", None)
+            self.__dict__.pop("shape_tuple", None)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        # Updated fields bypass `__setattr__`, so the copied shapes may be
+        # stale.
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not self._SHAPE_FIELDS.isdisjoint(update):
+            copied.__dict__.pop("shape", None)
+            copied.__dict__.pop("shape_tuple", None)
+        return copied
+
+    @cached_property
     def shape(self) -> CubeSize:
         return CubeSize(
             nrows=self.nrows, ncolumns=self.ncols, nbands=self.nbands
         )
 
-    @property
+    @cached_property
     def shape_tuple(self) -> tuple[int, int, int]:
         return self.shape.as_tuple(self.interleave)
 
@@ -161,31 +221,41 @@ class CubeContext(BaseModel):
 
     @property
     def builder(self) -> ContextBuilder:
-        _builder: ContextBuilder = {
-            "name": self.name,
-            "description": self.description,
-            "data_filename": self.data_filename,
-            "ncols": self.ncols,
-            "nrows": self.nrows,
-            "nbands": self.nbands,
-            "hdr_off": self.hdr_off,
-            "data_type": self.data_type,
-            "interleave": self.interleave,
-            "crs": self.crs,
-            "geotransform": self.geotransform,
-            "band_names": self.band_names,
-            "nodata": self.nodata,
-            "measurement_name": self.measurement_name,
-            "measurement_units": self.measurement_units,
-            "measurement_values": self.measurement_values,
-            "bad_bands": self.bad_bands,
-            "id": self.id,
-        }
-        return _builder
+        # A fresh dict on every access, callers update it in place. The list
+        # fields are copied too, so a context built from it (which skips
+        # validation) does not share them with this one.
+        fields = self.__dict__
+        builder = {k: fields[k] for k in _BUILDER_KEYS}
+        for k in _LIST_KEYS:
+            builder[k] = list(builder[k])
+        return cast(ContextBuilder, builder)
+
+    @classmethod
+    def _normalize_builder(
+        cls, builder_dict: ContextBuilder
+    ) -> ContextBuilder:
+        """Fills an empty bad band list with all good bands."""
+        if len(builder_dict["bad_bands"]) > 0:
+            return builder_dict
+        normalized = builder_dict.copy()
+        normalized["bad_bands"] = [1] * builder_dict["nbands"]
+        return normalized
 
     @classmethod
     def from_builder(cls, builder_dict: ContextBuilder) -> Self:
-        return cls(**builder_dict)
+        return cls(**cls._normalize_builder(builder_dict))
+
+    @classmethod
+    def _from_trusted_dict(cls, builder_dict: ContextBuilder) -> Self:
+        """
+        Builds the model without validation.
+
+        Only for builders derived from the `builder` of an existing, already
+        validated context, with updated fields that are already the right
+        types. Nothing is checked, so a builder read from a file or profile
+        must go through `from_builder` instead.
+        """
+        return cls.model_construct(**builder_dict)
 
     @classmethod
     def from_json(cls, savefp: str | Path) -> Self:
@@ -233,41 +303,17 @@ class CubeContext(BaseModel):
         }
         return cls.from_builder(_builder)
 
-    @field_serializer("interleave", mode="plain")
-    def lowercase(self, value: CubeArrayFormat) -> str:
-        return value.lower()
-
-    @field_validator("interleave", mode="before")
-    @classmethod
-    def uppercase(cls, value: str) -> CubeArrayFormat:
-        ustr = value.upper()
-        if is_valid_cubearrayformat(ustr):
-            return ustr
-        else:
-            raise ValueError(f"Invalid interleave: {ustr}")
-
     @model_validator(mode="after")
-    def set_default_bbl(self) -> Self:
-        current_bbl = self.bad_bands
-        if len(current_bbl) == 0:
-            self.bad_bands = [1] * len(self.measurement_values)
-        else:
-            self.bad_bands = current_bbl
-
-        if len(self.bad_bands) != self.nbands:
-            print(self.bad_bands)
-            raise ValueError(
-                "Length of bad band list must match the number of bands."
-            )
-
-        return self
-
-    @model_validator(mode="after")
-    def check_measurement_values(self) -> Self:
+    def _post_check(self) -> Self:
         if len(self.measurement_values) != self.nbands:
             raise ValueError(
                 "Length of measurement values must match the number of bands."
             )
+        if len(self.bad_bands) != self.nbands:
+            raise ValueError(
+                f"Length of bad band list ({len(self.bad_bands)}) must match "
+                f"the number of bands ({self.nbands}): {self.bad_bands!r}"
+            )
         return self
 
     def set_retrieval_path(self, retrieval_path: Path) -> None:
@@ -303,68 +349,79 @@ class CubeContext(BaseModel):
         else:
             savefp = savefp.with_suffix(".hdr")
 
-        # Need a temporary image and hdr file to write to. These will be empty.
-        temp_img = savefp.with_name(f"_{savefp.name}").with_suffix(".img")
-        temp_hdr = temp_img.with_suffix(".hdr")
-
-        # Need a rasterio profile to do a proper write.
-        envi_profile: RasterioProfile = {
-            "driver": "ENVI",
-            "width": 1,
-            "height": 1,
-            "count": 1,
-            "dtype": self.data_type,
-            "crs": self.crs,
-            "transform": self.geotransform.toaffine(),
-            "interleave": self.interleave,
-            "nodata": -999,
-        }
-
-        # A blank image write is needed. We just use the .hdr file.
-        with rio.open(temp_img, "w", **envi_profile) as f:
-            f.write(np.empty((1, 1, 1)))
-
-        temp_img.unlink()  # Discarding temporary image.
-        if temp_img.with_suffix(".img.aux.xml").exists():  # Discarding xml
-            temp_img.with_suffix(".img.aux.xml").unlink()
+        # Georeferencing is left out for a cube without a CRS. A CRS that
+        # cannot be parsed raises, rather than silently writing a header
+        # without georeferencing.
+        georeference = ""
+        if self.crs:
+            crs = CRS.from_user_input(self.crs)
+            georeference = (
+                "map info = "
+                f"{envi_map_info(crs, self.geotransform.toaffine())}\n"
+                "coordinate system string = "
+                f"{{{crs.to_wkt(version=WktVersion.WKT1_ESRI)}}}\n"
+            )
 
-        # Modifying rasterio-written .hdr file.
-        # These are existing fields.
-        replace_shape_fields(
-            temp_hdr,
+        hdr_str = ENVI_HDR_TEMPLATE.format(
+            description=textwrap.fill(self.description.strip(), width=80),
             samples=self.ncols,
             lines=self.nrows,
             bands=self.nbands,
+            header_offset=self.hdr_off,
+            data_type=dtype_to_hdr_integer[self.data_type],
+            interleave=self.interleave.lower(),
+            georeference=georeference,
+            band_names=",\n".join(self.band_names),
+            nodata=self.nodata,
+            measurement_units=self.measurement_units,
+            wavelengths=",".join(map(str, self.measurement_values)),
+            bbl=",".join(map(str, self.bad_bands)),
         )
-        replace_hdr_band_names(temp_hdr, self.band_names)
-        replace_hdr_description(temp_hdr, self.description)
-
-        with open(temp_hdr, "a") as f:
-            # Still unsure if I need this...
-            # f.write(f"data ignore value = {self.nodata}\n")
-
-            # These are all new fields.
-            f.write(f"wavelenth units = {self.measurement_units}\n")
-            f.write(
-                "wavelength = "
-                f"{{{",".join([str(i) for i in self.measurement_values])}}}\n"
-            )
-            f.write(
-                "bbl = " f"{{{",".join([str(i) for i in self.bad_bands])}}}\n"
-            )
-        # Renaming the temporary hdr that was created with the temp image.
-        shutil.move(temp_hdr, temp_hdr.with_name(temp_hdr.name[1:]))
+        # Written next to the destination and renamed into place, so readers
+        # never see a partially written header. The temporary file is created
+        # with the usual permissions of a new file (0666 less the umask), or
+        # takes those of the header it replaces.
+        tmp_fp = savefp.with_name(f".{savefp.name}.{uuid4().hex}.tmp")
+        try:
+            fd = os.open(tmp_fp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            with os.fdopen(fd, "w") as f:
+                f.write(hdr_str)
+            try:
+                os.chmod(tmp_fp, stat.S_IMODE(os.stat(savefp).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_fp, savefp)
+        except BaseException:
+            tmp_fp.unlink(missing_ok=True)
+            raise
 
         # Writing out the pydantic model in json form for easy reading.
         self.write_json(savefp)
 
     def write_json(self, savefp: str | Path) -> None:
         """Convenience function for dumping the model to a json file."""
-        json_str = self.model_dump_json(indent=2)
-        with open(Path(savefp).with_suffix(".json"), "w") as f:
-            f.write(json_str)
+        # Serializing straight to bytes skips the str decode/encode round trip
+        # of `model_dump_json`.
+        json_bytes = type(self).__pydantic_serializer__.to_json(self, indent=2)
+        Path(savefp).with_suffix(".json").write_bytes(json_bytes)
+
+    def lazy_load_data(
+        self,
+        search_dir: str | Path | None = None,
+        access: MemmapAccess = "sequential",
+    ) -> CubeData:
+        """
+        Lazily loads the image data next to the context file.
 
-    def lazy_load_data(self, search_dir: str | Path | None = None) -> CubeData:
+        Parameters
+        ----------
+        search_dir: str | Path | None, optional
+            Directory to search for the data, if the context was not read
+            from disk.
+        access: MemmapAccess, default="sequential"
+            Expected access pattern of binary (memory mapped) data, passed to
+            the OS as a madvise hint: "sequential", "random" or "willneed".
+        """
         load_from: Path
         if (search_dir is not None) and (
             self._retrieval_path == "NoRetrieval"
@@ -389,22 +446,43 @@ class CubeContext(BaseModel):
             geotransform=self.geotransform,
             nodata=self.nodata,
         )
-        candidate_image_data_files: list[tuple[Path, ImageSuffix]] = []
-        for i in load_from.iterdir():
-            if i.stem == str(self.data_filename.stem):
-                suff = i.suffix.lower()
-                if is_valid_image_suffix(suff):
-                    candidate_image_data_files.append((i, suff))
-
-        candidate_image_data_files.sort(
-            key=lambda item: image_suffix_priority[item[1]]
-        )
-
-        image_data_file = candidate_image_data_files[0][0]
+        # Probing the few possible names directly, in priority order, rather
+        # than scanning the whole directory.
+        stem = str(self.data_filename.stem)
+        image_data_file: Path | None = None
+        for suff in image_suffixes_by_priority:
+            for candidate_suffix in (suff, suff.upper()):
+                candidate = Path(load_from, f"{stem}{candidate_suffix}")
+                if candidate.exists():
+                    image_data_file = candidate
+                    break
+            if image_data_file is not None:
+                break
+
+        # Mixed case suffixes (e.g. scene.Img) are only found by scanning.
+        if image_data_file is None:
+            candidate_image_data_files: list[tuple[Path, ImageSuffix]] = []
+            for i in load_from.iterdir():
+                if i.stem == stem:
+                    found_suffix = i.suffix.lower()
+                    if is_valid_image_suffix(found_suffix):
+                        candidate_image_data_files.append((i, found_suffix))
+            if len(candidate_image_data_files) > 0:
+                image_data_file = min(
+                    candidate_image_data_files,
+                    key=lambda item: image_suffix_priority[item[1]],
+                )[0]
+
+        if image_data_file is None:
+            raise FileNotFoundError(
+                f"No image data found for {stem} in {load_from}."
+            )
 
         print(f"Lazy Loading from: {image_data_file}")
 
-        interleave_test = suffix_to_format_map.get(image_data_file.suffix)
+        interleave_test = suffix_to_format_map.get(
+            image_data_file.suffix.lower()
+        )
 
         if (interleave_test is not None) and (
             interleave_test != self.interleave
@@ -420,14 +498,15 @@ class CubeContext(BaseModel):
                 dtype=np.dtype(self.data_type),
                 shape=self.shape_tuple,
             )
-            dat.array = xr.DataArray(mmap)
+            advise_memmap(mmap, access)
+            dat.array = mmap
         elif image_data_file.suffix.lower() == ".hdf5":
             raise NotImplementedError("HDF5 file not implemented yet.")
         elif image_data_file.suffix.lower() == ".zarr":
             arr = xr.open_zarr(image_data_file).data
-            dat.ydim_name = str(arr.dims[0])
-            dat.xdim_name = str(arr.dims[1])
-            dat.zdim_name = str(arr.dims[2])
+            dat.ydim_name = sys.intern(str(arr.dims[0]))
+            dat.xdim_name = sys.intern(str(arr.dims[1]))
+            dat.zdim_name = sys.intern(str(arr.dims[2]))
             dat.array = arr
         elif image_data_file.suffix.lower() in [".tiff", ".tif"]:
             zarr = tiff.imread(image_data_file, aszarr=True)
@@ -445,3 +524,14 @@ class CubeContext(BaseModel):
             dat.array = da
 
         return dat
+
+
+# Taken from the model fields, so `CubeContext.builder` cannot drift from the
+# schema.
+_BUILDER_KEYS: Final[tuple[str, ...]] = tuple(CubeContext.model_fields)
+# Mutable fields that `CubeContext.builder` copies.
+_LIST_KEYS: Final[tuple[str, ...]] = (
+    "band_names",
+    "measurement_values",
+    "bad_bands",
+)
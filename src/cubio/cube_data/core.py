@@ -5,11 +5,14 @@ The core of the CubeData object.
 from __future__ import annotations
 
 # Built-Ins
+import sys
+from functools import lru_cache
 from typing import Optional
 
 # Dependencies
 import xarray as xr
 import numpy as np
+import pandas as pd
 
 # Package-Level Imports
 from cubio.types import (
@@ -19,12 +22,23 @@ from cubio.types import (
     TrimDirection,
 )
 from cubio.geotools.models import GeotransformModel
-from cubio.cube_size_tools import get_cube_size, CubeSize
+from cubio.cube_size_tools import CubeSize
 
 # SubPackage-Level Imports
 from .validation import array_is_set
 
 
+@lru_cache(maxsize=32)
+def _index_array(n: int) -> np.ndarray:
+    """
+    Read-only int64 index array of length `n`, shared between every cube with
+    an axis of that size.
+    """
+    arr = np.arange(n, dtype=np.int64)
+    arr.setflags(write=False)
+    return arr
+
+
 class CubeDataCore:
     """
     Core CubeData class. Built for storing the data and metadata of an image
@@ -59,6 +73,29 @@ class CubeDataCore:
         Value to use for nodata. Default is -999.
     """
 
+    # Every attribute of the cube, including those set by the mix-ins, so
+    # attribute access is a slot lookup rather than a __dict__ one.
+    __slots__ = (
+        "name",
+        "_gtrans",
+        "nodata",
+        "_fmt",
+        "rowindex",
+        "colindex",
+        "bandindex",
+        "_array",
+        "_xcoords",
+        "_ycoords",
+        "_zcoords",
+        "xdim_name",
+        "ydim_name",
+        "zdim_name",
+        "_shape",
+        "_trim_direction",
+        "_mask",
+        "_builder",
+    )
+
     def __init__(
         self,
         name: str,
@@ -87,9 +124,10 @@ class CubeDataCore:
         self._ycoords = ycoord_label
         self._zcoords = zcoord_label
 
-        self.xdim_name = x_name
-        self.ydim_name = y_name
-        self.zdim_name = z_name
+        # Interned, as these are the dim keys of every xarray lookup.
+        self.xdim_name = sys.intern(x_name)
+        self.ydim_name = sys.intern(y_name)
+        self.zdim_name = sys.intern(z_name)
 
         self._shape: CubeSize | None = None
 
@@ -106,30 +144,33 @@ class CubeDataCore:
         self.rowindex = idx.row
         self.colindex = idx.col
         self.bandindex = idx.band
+        self._shape = None  # Shape is read in the new format.
 
     @property
     def shape(self) -> CubeSize:
         if self._shape is None:
             self._array = array_is_set(self._array)
-            self._shape = get_cube_size(self._array, self.fmt)
+            self._shape = self._cube_size(self._array.shape)
         return self._shape
 
+    # Default index coordinates are not stored, so `_create_coords_dict` keeps
+    # building them as a RangeIndex.
     @property
     def xcoords(self) -> LabelLike:
         if self._xcoords is None:
-            self._xcoords = np.arange(0, self.shape.ncolumns)
+            return _index_array(self.shape.ncolumns)
         return self._xcoords
 
     @property
     def ycoords(self) -> LabelLike:
         if self._ycoords is None:
-            self._ycoords = np.arange(0, self.shape.nrows)
+            return _index_array(self.shape.nrows)
         return self._ycoords
 
     @property
     def zcoords(self) -> LabelLike:
         if self._zcoords is None:
-            self._zcoords = np.arange(0, self.shape.nbands)
+            return _index_array(self.shape.nbands)
         return self._zcoords
 
     @property
@@ -139,46 +180,92 @@ class CubeDataCore:
         return self._array
 
     @array.setter
-    def array(self, value: xr.DataArray) -> None:
+    def array(self, value: xr.DataArray | np.ndarray) -> None:
         if value.ndim == 2:
-            value = value.expand_dims(dim={self.zdim_name: 1}, axis=2)
-        self._shape = get_cube_size(value, self.fmt)
+            # Relabeled below anyway, so only the data gets the new axis.
+            if isinstance(value, xr.DataArray):
+                value = value.data
+            value = value[:, :, np.newaxis]
+        self._shape = self._cube_size(value.shape)
+        # The array read back from `array` is already labeled for this cube,
+        # so setting it again skips the coordinate rebuild. Any other
+        # DataArray is relabeled, since its coordinates may belong to a
+        # different cube.
+        if value is self._array:
+            return
         self._array = self._create_labeled_dataarray(value)  # Labeled array.
 
+    def _cube_size(self, array_shape: tuple[int, ...]) -> CubeSize:
+        """Reads the cube size from an array shape in the current format."""
+        return CubeSize(
+            nrows=array_shape[self.rowindex],
+            ncolumns=array_shape[self.colindex],
+            nbands=array_shape[self.bandindex],
+        )
+
     def _create_dims_tuple(self) -> tuple[str, str, str]:
         """
         Creates a tuple of string dim names in the correct order for the
         current array format.
         """
-        _n = np.array(
-            [self.ydim_name, self.xdim_name, self.zdim_name]
-        )  # names
+        _n = (self.ydim_name, self.xdim_name, self.zdim_name)  # names
         dims = (_n[self.rowindex], _n[self.colindex], _n[self.bandindex])
         return dims
 
-    def _create_coords_dict(self) -> dict[str, LabelLike]:
-        # All coordinate arrays are index arrays, if not set.
-        coordinate_dict = {
-            self.xdim_name: self.xcoords,
-            self.ydim_name: self.ycoords,
-            self.zdim_name: self.zcoords,
+    def _create_coords_dict(self) -> dict[str, LabelLike | pd.RangeIndex]:
+        # All coordinate arrays are index arrays, if not set. These are passed
+        # as a RangeIndex, which xarray keeps without building a hash table.
+        shp = self.shape
+        coordinate_dict: dict[str, LabelLike | pd.RangeIndex] = {
+            self.xdim_name: (
+                pd.RangeIndex(shp.ncolumns)
+                if self._xcoords is None
+                else self._xcoords
+            ),
+            self.ydim_name: (
+                pd.RangeIndex(shp.nrows)
+                if self._ycoords is None
+                else self._ycoords
+            ),
+            self.zdim_name: (
+                pd.RangeIndex(shp.nbands)
+                if self._zcoords is None
+                else self._zcoords
+            ),
         }
         return coordinate_dict
 
-    def _create_labeled_dataarray(self, value: xr.DataArray) -> xr.DataArray:
+    def _create_labeled_dataarray(
+        self, value: xr.DataArray | np.ndarray
+    ) -> xr.DataArray:
         """
-        Creates a new xarray dataarray from an existing dataarray but with the
-        correct coords and dimension names in the correct order for the current
-        cube format.
+        Creates a new xarray dataarray from an existing dataarray or a plain
+        numpy array, with the correct coords and dimension names in the
+        correct order for the current cube format.
         """
         dims = self._create_dims_tuple()
         crds = self._create_coords_dict()
+        data = value.data if isinstance(value, xr.DataArray) else value
         return xr.DataArray(
-            value.data,
+            data,
             coords=crds,
             dims=dims,
         )
 
+    def _refresh_coords(self) -> None:
+        """
+        Relabels the current array in place of rebuilding it, renaming the
+        dimensions if needed and regenerating the coordinates.
+        """
+        if self._array is None:
+            return
+        dims = self._create_dims_tuple()
+        if dims != self._array.dims:
+            self._array = self._array.rename(
+                dict(zip(self._array.dims, dims))
+            )
+        self._array = self._array.assign_coords(self._create_coords_dict())
+
     def reset_coords(
         self,
         xcoord_label: Optional[LabelLike] = None,
@@ -23,6 +23,8 @@ class CubeData(MaskingMixIn, GeospatialMixIn, TransformationMixIn):
     - Handles the geotransform of the data cube.
     """
 
+    __slots__ = ()
+
     def add_shapefile_mask(self, shapefile_fp: str | Path) -> None:
         if self._gtrans is None:
             raise ValueError(
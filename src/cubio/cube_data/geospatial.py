@@ -3,6 +3,7 @@ from warnings import warn
 
 # Dependencies
 import xarray as xr
+import pandas as pd
 
 # Local Imports
 from cubio.types import LabelLike
@@ -16,6 +17,8 @@ from .validation import array_is_set
 
 
 class GeospatialMixIn(CubeDataCore):
+    __slots__ = ()
+
     @property
     def geotransform(self) -> GeotransformModel:
         if self._gtrans is None:
@@ -27,15 +30,22 @@ class GeospatialMixIn(CubeDataCore):
     @geotransform.setter
     def geotransform(self, value: GeotransformModel) -> None:
         self._gtrans = value
-        self.array = self.array
+        self._refresh_coords()
 
     def _get_current_geotransform(self) -> GeotransformModel:
         if self._gtrans is None:
             raise ValueError("Geotransform is not set yet.")
+        # Only trimming can move the upper left corner, so the masked copy
+        # from `array` is only needed then; otherwise the coords of the raw
+        # array are read as plain numpy values.
+        if self._trim_direction == "NoTrim":
+            coords = array_is_set(self._array).coords
+        else:
+            coords = self.array.coords
         return GeotransformModel(
             upperleft=PointModel(
-                x=self.array.coords["Longitude"][0],
-                y=self.array.coords["Latitude"][0],
+                x=float(coords["Longitude"].values[0]),
+                y=float(coords["Latitude"].values[0]),
             ),
             xres=self._gtrans.xres,
             row_rotation=self._gtrans.row_rotation,
@@ -43,11 +53,11 @@ class GeospatialMixIn(CubeDataCore):
             col_rotation=self._gtrans.col_rotation,
         )
 
-    def _create_coords_dict(self) -> dict[str, LabelLike]:
+    def _create_coords_dict(self) -> dict[str, LabelLike | pd.RangeIndex]:
         # X and Y labels should be replaced with coordinates, if geotransform
         # is set, otherwise, fall back on core behavior.
         if self._gtrans is not None:
-            self._xcoords, self._ycoords = self.geotransform.generate_coords(
+            self._xcoords, self._ycoords = self._gtrans.generate_coords(
                 width=self.shape.ncolumns, height=self.shape.nrows
             )
         return super()._create_coords_dict()
@@ -1,7 +1,9 @@
+# Built-Ins
+from typing import Any
+
 # Dependencies
 import xarray as xr
-
-# import numpy as np
+import numpy as np
 
 # Local
 from cubio.cube_mask import CubeMask, MaskBuilder
@@ -9,6 +11,10 @@ from cubio.types import MaskType, TrimDirection
 from .core import CubeDataCore
 from .validation import array_is_set
 
+# The core setter, looked up once: no other mix-in overrides `array`, so
+# this is what the MRO would resolve to on every assignment.
+_core_array_fset = CubeDataCore.array.fset  # type: ignore[attr-defined]
+
 
 class MaskingMixIn(CubeDataCore):
     """
@@ -23,10 +29,18 @@ class MaskingMixIn(CubeDataCore):
     applies over the measured dimension (the "back" of the cube).
     """
 
+    __slots__ = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Created on first access, once the cube shape is known.
+        self._mask: CubeMask | None = None
+        self._builder: MaskBuilder | None = None
+
     @property
     def mask(self) -> CubeMask:
-        if not hasattr(self, "_mask"):
-            self._builder: MaskBuilder = {
+        if self._mask is None:
+            self._builder = {
                 "shape": self.shape,
                 "xdim_name": self.xdim_name,
                 "ydim_name": self.ydim_name,
@@ -46,10 +60,8 @@ class MaskingMixIn(CubeDataCore):
         return self._handle_trimming(masked_arr)
 
     @array.setter
-    def array(self, value: xr.DataArray) -> None:
-        # This line is directly from property inheritance example:
-        # https://gist.github.com/Susensio/979259559e2bebcd0273f1a95d7c1e79
-        super(MaskingMixIn, type(self)).array.fset(self, value)  # type: ignore
+    def array(self, value: xr.DataArray | np.ndarray) -> None:
+        _core_array_fset(self, value)
 
     def reset_mask(self, which: MaskType = "both") -> None:
         """
@@ -81,8 +93,17 @@ class MaskingMixIn(CubeDataCore):
     def add_nodata_mask(self) -> None:
         """Adds a mask to the current cube mask based on the nodata value."""
         valid_array = array_is_set(self._array)
-        nodata = valid_array[:, :, 0].drop_vars(self.zdim_name) == self.nodata
-        self.mask.add_to_xymask(nodata)
+        # First band of the raw data, whatever axis the bands are on. The
+        # band is selected on the backing array before it is loaded, so a
+        # lazy cube only computes that one band.
+        idx: list[int | slice] = [slice(None)] * 3
+        idx[self.bandindex] = 0
+        nodata = np.asarray(valid_array.data[tuple(idx)]) == self.nodata
+        if self.colindex < self.rowindex:  # e.g. BSQ: (cols, rows) left
+            nodata = nodata.T
+        self.mask.add_to_xymask(
+            xr.DataArray(nodata, dims=(self.ydim_name, self.xdim_name))
+        )
 
     def _apply_mask(
         self,
@@ -99,15 +120,85 @@ class MaskingMixIn(CubeDataCore):
             Whether to drop the masked coordinates from the dataarray.
         """
         self._array = array_is_set(self._array)  # Validation
+        # Masks are not applied on read: the backing array is returned as
+        # is, and masked selections come from `isel_masked`.
         # masks = {
         #     "both": ~self.mask.xymask & ~self.mask.zmask,
         #     "xy": ~self.mask.xymask,
         #     "z": ~self.mask.zmask,
         # }
-        # return self._array
         # return self._array.where(masks[which], np.nan, drop=False)
         return self._array
 
+    def isel_masked(self, **indexers: int | slice) -> xr.DataArray:
+        """
+        Selects part of the data cube by integer index and applies the mask
+        to that part only, so reading a small region of a large cube does not
+        mask the whole cube.
+
+        Parameters
+        ----------
+        **indexers: int | slice
+            Integer index or slice for any of the cube dimensions, by name.
+
+        Notes
+        -----
+        Array trimming is not applied to the selection.
+        """
+        valid_array = array_is_set(self._array)
+        subset = valid_array.isel(indexers)
+
+        # The masks are indexed by axis position and relabeled with the
+        # current dim names, so they line up with the data whatever names
+        # they were built with.
+        masks: list[xr.DataArray] = []
+        if not self.mask.xymask_is_empty:
+            masks.append(
+                self._select_mask(
+                    self.mask.xymask.values,
+                    (self.ydim_name, self.xdim_name),
+                    indexers,
+                )
+            )
+        if not self.mask.zmask_is_empty:
+            masks.append(
+                self._select_mask(
+                    self.mask.zmask.values, (self.zdim_name,), indexers
+                )
+            )
+        if len(masks) == 0:
+            return subset
+
+        # Float output, so masked values can be NaN: float32 for inputs of
+        # up to 4 bytes, float64 otherwise.
+        out_dtype = np.float32 if subset.dtype.itemsize <= 4 else np.float64
+        subset = subset.astype(out_dtype)
+        for mask in masks:
+            subset = subset.where(~mask)
+        return subset
+
+    @staticmethod
+    def _select_mask(
+        values: np.ndarray,
+        dims: tuple[str, ...],
+        indexers: dict[str, int | slice],
+    ) -> xr.DataArray:
+        """Selects a mask array along `dims`, dropping integer-indexed dims."""
+        idx = tuple(indexers.get(d, slice(None)) for d in dims)
+        kept = tuple(d for d, i in zip(dims, idx) if not isinstance(i, int))
+        return xr.DataArray(values[idx], dims=kept)
+
+    def _refresh_coords(self) -> None:
+        super()._refresh_coords()
+        # Keeping the mask dims in step with renamed array dims (e.g. to
+        # Latitude/Longitude once a geotransform is set).
+        if self._mask is not None:
+            self._mask.rename_dims(
+                xdim_name=self.xdim_name,
+                ydim_name=self.ydim_name,
+                zdim_name=self.zdim_name,
+            )
+
     def get_unmasked_array(self, ignore: MaskType = "both") -> xr.DataArray:
         """
         Get the unmasked version of the data cube.
@@ -1,15 +1,29 @@
 from .core import CubeDataCore
-from cubio.types import CubeArrayFormat
+from .validation import array_is_set
+from cubio.types import CubeArrayFormat, FORMAT_INDICES
 from cubio.cube_size_tools import transpose_cube
+import numpy as np
 import xarray as xr
 
 
 class TransformationMixIn(CubeDataCore):
+    __slots__ = ()
+
     def transpose_to(self, format: CubeArrayFormat) -> None:
-        old_format = self.fmt
+        old_idx = FORMAT_INDICES[self.fmt]
+        new_idx = FORMAT_INDICES[format]
+        # Axis permutation that takes the rows, columns and bands from their
+        # old axes onto their new ones.
+        perm = [0, 0, 0]
+        perm[new_idx.row] = old_idx.row
+        perm[new_idx.col] = old_idx.col
+        perm[new_idx.band] = old_idx.band
+        # Transposing the raw backing array: the mask is kept separately and
+        # applies on read, so it does not need to be baked in here. The
+        # numpy transpose is a view, labeled once by the array setter.
+        data = np.transpose(array_is_set(self._array).data, perm)
         self.fmt = format
-        new_arr = transpose_cube(old_format, format, self.array)
-        self.array = new_arr
+        self.array = data
 
     def transpose_to_rasterio(self) -> xr.DataArray:
         return transpose_cube(self.fmt, "RASTERIO", self.array)
@@ -38,8 +38,18 @@ class CubeMask:
         if (z_mask is not None) and (z_mask.dtype != bool):
             raise ValueError("Z Mask must be of dtype: bool")
 
+        # Masks are stored bit-packed (8 flags per byte), so combining them
+        # moves an eighth of the memory. The unpacked DataArrays are only
+        # rebuilt when they are read.
+        self._xy_shape = (shape.nrows, shape.ncolumns)
+        self._xy_packed = None if xy_mask is None else _pack(xy_mask)
+        self._z_packed = None if z_mask is None else _pack(z_mask)
         self._xymask = xy_mask
         self._zmask = z_mask
+        # Whether a mask is known to mask nothing, so applying it can be
+        # skipped. Only `transparent` masks start out empty.
+        self._xy_all_false = False
+        self._z_all_false = False
         self.xdim_name = xdim_name
         self.ydim_name = ydim_name
         self.zdim_name = zdim_name
@@ -52,79 +62,156 @@ class CubeMask:
         ydim_name: str,
         zdim_name: str,
     ) -> Self:
-        xy_mask = xr.DataArray(
-            np.zeros((shape.nrows, shape.ncolumns), dtype=bool),
-            dims=(ydim_name, xdim_name),
-        )
-        z_mask = xr.DataArray(
-            np.zeros(shape.nbands, dtype=bool),
-            dims=(zdim_name),
-        )
-        return cls(
+        # No mask arrays at all: the flags below stand in for them until a
+        # mask is first added.
+        mask = cls(
             shape=shape,
             xdim_name=xdim_name,
             ydim_name=ydim_name,
             zdim_name=zdim_name,
-            xy_mask=xy_mask,
-            z_mask=z_mask,
         )
+        mask._xy_all_false = True
+        mask._z_all_false = True
+        return mask
+
+    @property
+    def xymask_is_empty(self) -> bool:
+        """True if the xy mask is known to mask nothing."""
+        return self._xy_all_false
+
+    @property
+    def zmask_is_empty(self) -> bool:
+        """True if the z mask is known to mask nothing."""
+        return self._z_all_false
 
     @property
     def xymask(self) -> xr.DataArray:
         if self._xymask is None:
-            raise ValueError("XY Mask not set yet.")
+            if self._xy_packed is not None:
+                data = _unpack(self._xy_packed, self._xy_shape)
+            elif self._xy_all_false:
+                # Zero-stride, read-only view of a single False.
+                data = np.broadcast_to(np.False_, self._xy_shape)
+            else:
+                raise ValueError("XY Mask not set yet.")
+            self._xymask = xr.DataArray(
+                data, dims=(self.ydim_name, self.xdim_name)
+            )
         return self._xymask
 
     @xymask.setter
     def xymask(self, value: xr.DataArray) -> None:
-        if value.dtype != bool:
-            raise ValueError(f"XY Mask must be of type bool not {value.dtype}")
-        if value.ndim != 2:
-            raise ValueError(
-                f"Invalid number of xy mask dimensions: {value.ndim}"
-            )
-        if self._xymask is None:
-            raise ValueError("XY Mask is not set.")
-        self._xymask.rename((self.ydim_name, self.xdim_name))
+        self._validate_xymask(value)
+        self._xy_packed = _pack(value)
         self._xymask = value
+        self._xy_all_false = False
 
     @property
     def zmask(self) -> xr.DataArray:
         if self._zmask is None:
-            raise ValueError("Z Mask not set yet.")
-        self._zmask.rename(self.zdim_name)
+            if self._z_packed is not None:
+                data = _unpack(self._z_packed, (self.shape.nbands,))
+            elif self._z_all_false:
+                data = np.broadcast_to(np.False_, (self.shape.nbands,))
+            else:
+                raise ValueError("Z Mask not set yet.")
+            self._zmask = xr.DataArray(data, dims=(self.zdim_name,))
         return self._zmask
 
     @zmask.setter
     def zmask(self, value: xr.DataArray) -> None:
+        self._validate_zmask(value)
+        self._z_packed = _pack(value)
+        self._zmask = value
+        self._z_all_false = False
+
+    def rename_dims(
+        self, *, xdim_name: str, ydim_name: str, zdim_name: str
+    ) -> None:
+        """Renames the mask dimensions, e.g. after the cube dims changed."""
+        if (xdim_name, ydim_name, zdim_name) == (
+            self.xdim_name,
+            self.ydim_name,
+            self.zdim_name,
+        ):
+            return
+        self.xdim_name = xdim_name
+        self.ydim_name = ydim_name
+        self.zdim_name = zdim_name
+        # The packed masks are unnamed; only the unpacked views are renamed.
+        if self._xymask is not None:
+            self._xymask = self._xymask.rename(
+                dict(zip(self._xymask.dims, (ydim_name, xdim_name)))
+            )
+        if self._zmask is not None:
+            self._zmask = self._zmask.rename(
+                {self._zmask.dims[0]: zdim_name}
+            )
+
+    def _validate_xymask(self, value: xr.DataArray) -> None:
+        """Single check of a new xy mask, for both assigning and adding."""
+        if value.dtype != bool:
+            raise ValueError(f"XY Mask must be of type bool not {value.dtype}")
+        if value.ndim != 2:
+            raise ValueError(
+                f"Invalid number of xy mask dimensions: {value.ndim}"
+            )
+        if value.shape != self._xy_shape:
+            raise ValueError(
+                f"XY Mask has invalid shape: {value.shape}, expected"
+                f" {self._xy_shape}"
+            )
+        if self._xy_packed is None and not self._xy_all_false:
+            raise ValueError("XY Mask is not set.")
+
+    def _validate_zmask(self, value: xr.DataArray) -> None:
+        """Single check of a new z mask, for both assigning and adding."""
         if value.dtype != bool:
             raise ValueError(f"Z Mask must be of type bool not {value.dtype}")
         if value.ndim != 1:
             raise ValueError(
-                f"Invalid number of xy mask dimensions: {value.ndim}"
+                f"Invalid number of z mask dimensions: {value.ndim}"
+            )
+        if value.shape != (self.shape.nbands,):
+            raise ValueError(
+                f"Z Mask has invalid shape: {value.shape}, expected"
+                f" {(self.shape.nbands,)}"
             )
-        self._zmask = value
 
     def add_to_xymask(self, new_mask: xr.DataArray) -> None:
-        if new_mask.dtype != bool:
-            raise ValueError(f"New Mask is not of type bool, {new_mask.dtype}")
-        if self._xymask is None:
-            raise ValueError("XYMask not set yet.")
-        if new_mask.ndim != 2:
-            raise ValueError(
-                f"New mask has invalid dimensions: {new_mask.ndim}"
+        self._validate_xymask(new_mask)
+        if not new_mask.values.any():  # Masks nothing, so changes nothing
+            return
+        if self._xy_packed is None:  # First mask added to a transparent one
+            self._xy_packed = _pack(new_mask)
+        else:
+            # In place: the packed arrays are always owned by this mask.
+            np.bitwise_or(
+                self._xy_packed, _pack(new_mask), out=self._xy_packed
             )
-        new_mask.rename((self.ydim_name, self.xdim_name))
-        self.xymask = self._xymask | new_mask
+        self._xymask = None
+        self._xy_all_false = False
 
     def add_to_zmask(self, new_mask: xr.DataArray) -> None:
-        if new_mask.dtype != bool:
-            raise ValueError(f"New Mask is not of type bool, {new_mask.dtype}")
-        if self._zmask is None:
+        self._validate_zmask(new_mask)
+        if self._z_packed is None and not self._z_all_false:
             raise ValueError("ZMask not set yet.")
-        if new_mask.ndim != 1:
-            raise ValueError(
-                f"New mask has invalid dimensions: {new_mask.ndim}"
-            )
-        new_mask.rename((self.zdim_name))
-        self.zmask = self._zmask | new_mask
+        if not new_mask.values.any():
+            return
+        if self._z_packed is None:
+            self._z_packed = _pack(new_mask)
+        else:
+            np.bitwise_or(self._z_packed, _pack(new_mask), out=self._z_packed)
+        self._zmask = None
+        self._z_all_false = False
+
+
+def _pack(mask: xr.DataArray) -> np.ndarray:
+    """Packs a boolean mask into a flat uint8 array of bits."""
+    return np.packbits(mask.values, axis=None)
+
+
+def _unpack(packed: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    """Unpacks a bit-packed mask back into a boolean array of `shape`."""
+    count = int(np.prod(shape))
+    return np.unpackbits(packed, count=count).reshape(shape).view(bool)
@@ -14,28 +14,29 @@ from cubio.types import (
     NumpyDType,
     RasterioProfile,
     CubeArrayFormat,
+    MemmapAccess,
 )
-from cubio.envi_hdr_tools import (
-    extract_hdr_wavelengths,
-    extract_hdr_desc,
-    extract_hdr_bbl,
-    extract_hdr_band_names,
-)
+from cubio.envi_hdr_tools import read_hdr_fields
 from cubio.geotools.models import GeotransformModel
 from cubio.cube_size_tools import CubeSize
+from cubio.memmap_tools import advise_memmap
 from cubio.cube_context import CubeContext, ContextBuilder
 from cubio.cube_data import CubeData
 
 
 def read_binary_image_file(
-    fp: Path, size: CubeSize, data_type: NumpyDType
+    fp: Path,
+    size: CubeSize,
+    data_type: NumpyDType,
+    access: MemmapAccess = "sequential",
 ) -> xr.DataArray:
-    suff = fp.suffix
+    suff = fp.suffix.lower()
     binary_fmt = suffix_to_format_map.get(suff)
     if binary_fmt is not None:
         arr = np.memmap(
             fp, dtype=np.dtype(data_type), shape=size.as_tuple(binary_fmt)
         )
+        advise_memmap(arr, access)
         return xr.DataArray(arr)
     else:
         raise NotImplementedError()
@@ -69,10 +70,11 @@ def cubedata_from_envi_file(
         prf: RasterioProfile = f.profile
 
     hdr_fp = Path(envi_binary_fp).with_suffix(".hdr")
-    wvls = extract_hdr_wavelengths(hdr_fp)
-    desc = extract_hdr_desc(hdr_fp)
-    bbl = extract_hdr_bbl(hdr_fp)
-    band_names = extract_hdr_band_names(hdr_fp)
+    hdr = read_hdr_fields(hdr_fp)
+    wvls = hdr["wavelengths"]
+    desc = hdr["description"]
+    bbl = hdr["bbl"]
+    band_names = hdr["band_names"]
 
     if wvls == "Wavelengths not found.":
         wvls = [float(i) for i in range(prf["count"])]
@@ -15,6 +15,31 @@ import xarray as xr
 from cubio.types import CubeArrayFormat
 
 
+# Position of (nrows, ncolumns, nbands) in the array shape of each format.
+_SHAPE_ORDER: dict[CubeArrayFormat, tuple[int, int, int]] = {
+    "BIL": (0, 2, 1),
+    "BIP": (0, 1, 2),
+    "BSQ": (2, 1, 0),
+}
+
+# Source axes, in destination order, for each (source, destination) pair of
+# array formats. Pairs of the same format are left out.
+_TRANSPOSE_PERMS: dict[
+    tuple[CubeArrayFormat, CubeArrayFormat | Literal["RASTERIO"]],
+    tuple[int, int, int],
+] = {
+    ("BIL", "BIP"): (0, 2, 1),
+    ("BIL", "BSQ"): (1, 2, 0),
+    ("BIL", "RASTERIO"): (1, 0, 2),
+    ("BIP", "BIL"): (0, 2, 1),
+    ("BIP", "BSQ"): (2, 1, 0),
+    ("BIP", "RASTERIO"): (2, 0, 1),
+    ("BSQ", "BIL"): (2, 0, 1),
+    ("BSQ", "BIP"): (2, 1, 0),
+    ("BSQ", "RASTERIO"): (0, 2, 1),
+}
+
+
 @dataclass
 class CubeSize:
     nrows: int
@@ -22,12 +47,9 @@ class CubeSize:
     nbands: int
 
     def as_tuple(self, interleave: CubeArrayFormat) -> tuple[int, int, int]:
-        if interleave == "BIL":
-            return (self.nrows, self.nbands, self.ncolumns)
-        elif interleave == "BIP":
-            return (self.nrows, self.ncolumns, self.nbands)
-        elif interleave == "BSQ":
-            return (self.nbands, self.ncolumns, self.nrows)
+        fields = (self.nrows, self.ncolumns, self.nbands)
+        i, j, k = _SHAPE_ORDER[interleave]
+        return (fields[i], fields[j], fields[k])
 
 
 def get_cube_size(
@@ -48,30 +70,7 @@ def transpose_cube(
     dst: CubeArrayFormat | Literal["RASTERIO"],
     arr: xr.DataArray,
 ):
-    if src == "BIL":
-        if dst == "BIL":
-            return arr
-        elif dst == "BIP":
-            return arr.transpose(*(arr.dims[0], arr.dims[2], arr.dims[1]))
-        elif dst == "BSQ":
-            return arr.transpose(*(arr.dims[1], arr.dims[2], arr.dims[0]))
-        elif dst == "RASTERIO":
-            return arr.transpose(*(arr.dims[1], arr.dims[0], arr.dims[2]))
-    elif src == "BIP":
-        if dst == "BIL":
-            return arr.transpose(*(arr.dims[0], arr.dims[2], arr.dims[1]))
-        elif dst == "BIP":
-            return arr
-        elif dst == "BSQ":
-            return arr.transpose(*(arr.dims[2], arr.dims[1], arr.dims[0]))
-        elif dst == "RASTERIO":
-            return arr.transpose(*(arr.dims[2], arr.dims[0], arr.dims[1]))
-    elif src == "BSQ":
-        if dst == "BIL":
-            return arr.transpose(*(arr.dims[2], arr.dims[0], arr.dims[1]))
-        elif dst == "BIP":
-            return arr.transpose(*(arr.dims[2], arr.dims[1], arr.dims[0]))
-        elif dst == "BSQ":
-            return arr
-        elif dst == "RASTERIO":
-            return arr.transpose(*(arr.dims[0], arr.dims[2], arr.dims[1]))
+    perm = _TRANSPOSE_PERMS.get((src, dst))
+    if perm is None:  # Same format
+        return arr
+    return arr.transpose(*(arr.dims[i] for i in perm))
@@ -6,10 +6,14 @@ from cubio.cube_data import CubeData
 from cubio.types import (
     CubeArrayFormat,
     cube_array_suffix_map,
-    RasterioProfile,
 )
 
-import rasterio as rio  # type: ignore
+import numpy as np
+from numcodecs import Blosc  # type: ignore[import-untyped]
+
+# Compressor applied to every chunk written by `write_zarr`. Bit-shuffling
+# groups the exponent bits of float spectra, which zstd compresses well.
+ZARR_COMPRESSOR = Blosc(cname="zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
 
 
 def get_save_directory(
@@ -30,6 +34,10 @@ def get_save_directory(
     return save_dir
 
 
+# Size of the row blocks written to BIL and BIP files.
+_ROW_BLOCK_BYTES = 64 * 2**20
+
+
 def write_envi(
     cube_context: CubeContext,
     cube_data: CubeData,
@@ -54,18 +62,6 @@ def write_envi(
         path of the Cube Context, if it is set. If this value is not set,
         an error will be returned.
     """
-    prf: RasterioProfile = {
-        "height": cube_context.shape.nrows,
-        "width": cube_context.shape.ncolumns,
-        "count": cube_context.shape.nbands,
-        "crs": cube_context.crs,
-        "driver": "ENVI",
-        "dtype": cube_context.data_type,
-        "interleave": interleave,
-        "nodata": cube_context.nodata,
-        "transform": cube_context.geotransform.toaffine(),
-    }
-
     save_dir = get_save_directory(cube_context, dst_fp)
     save_fp = Path(
         save_dir,
@@ -73,10 +69,44 @@ def write_envi(
             cube_array_suffix_map[interleave]
         ),
     )
-    r_cube = cube_data.transpose_to_rasterio()
-    with rio.open(save_fp, "w", **prf) as f:
-        f.write(r_cube)
-    Path(save_fp.with_suffix(".hdr")).unlink()
+    # The raw binary is written straight into a memory map in the on-disk
+    # interleave, so the only header ever written is the cubio one below.
+    # Going through the GDAL ENVI driver wrote a header of its own that then
+    # had to be deleted and replaced. The array values are written as they
+    # are, without masking, as `write_zarr` does.
+    nrows = cube_context.shape.nrows
+    ncols = cube_context.shape.ncolumns
+    nbands = cube_context.shape.nbands
+    disk_shape = {
+        "BSQ": (nbands, nrows, ncols),
+        "BIL": (nrows, nbands, ncols),
+        "BIP": (nrows, ncols, nbands),
+    }[interleave]
+    dtype = np.dtype(cube_context.data_type).newbyteorder("<")
+    dst = np.memmap(save_fp, dtype=dtype, mode="w+", shape=disk_shape)
+    xdim = cube_data.xdim_name
+    ydim = cube_data.ydim_name
+    zdim = cube_data.zdim_name
+    array = cube_data.array
+    if interleave == "BSQ":
+        for b in range(nbands):
+            band = array.isel({zdim: b})
+            dst[b] = band.transpose(ydim, xdim).values
+    else:
+        # BIL and BIP store whole rows contiguously, so each block of rows
+        # is a single contiguous write.
+        if interleave == "BIL":
+            order = (ydim, zdim, xdim)
+        else:
+            order = (ydim, xdim, zdim)
+        row_bytes = ncols * nbands * dtype.itemsize
+        block_rows = max(1, _ROW_BLOCK_BYTES // row_bytes)
+        for r0 in range(0, nrows, block_rows):
+            r1 = min(r0 + block_rows, nrows)
+            block = array.isel({ydim: slice(r0, r1)})
+            dst[r0:r1] = block.transpose(*order).values
+    dst.flush()
+    del dst
 
     cube_context.interleave = interleave
     cube_context.write_envi_hdr(
@@ -91,6 +121,7 @@ def write_zarr(
     cube_data: CubeData,
     dst_fp: Path | str | None = None,
     mode: Literal["w"] = "w",
+    chunks: tuple[int, int] = (256, 256),
 ) -> None:
     """
     Writes an .zarr directory.
@@ -106,17 +137,36 @@ def write_zarr(
         File directory is either set by the function arg or by the retrieval
         path of the Cube Context, if it is set. If this value is not set,
         an error will be returned.
+    chunks: tuple[int, int], optional
+        Spatial (rows, columns) chunk size, by default (256, 256). Each chunk
+        holds every band, so a spectrum is always read from a single chunk.
+
+    Notes
+    -----
+    Chunks are compressed with `ZARR_COMPRESSOR` and the cube context is
+    stored in the array attributes, alongside the usual .json file.
     """
     save_dir = get_save_directory(cube_context, dst_fp)
     save_fp = Path(save_dir, cube_context.data_filename.with_suffix(".zarr"))
     cube_context.interleave = "BIP"
     cube_context.write_json(cube_context._retrieval_path)
     print(f"Saving zarr: {save_fp}")
-    if not save_fp.exists():
-        cube_data.array.to_zarr(
-            save_fp, zarr_format=2, consolidated=True, mode="w"
-        )
-    else:
-        cube_data.array.to_zarr(
-            save_fp, zarr_format=2, consolidated=True, mode=mode
-        )
+
+    arr = cube_data.array.chunk(
+        {
+            cube_data.ydim_name: chunks[0],
+            cube_data.xdim_name: chunks[1],
+            cube_data.zdim_name: -1,
+        }
+    )
+    arr = arr.assign_attrs(cube_context.model_dump(mode="json"))
+    encoding = {str(arr.name): {"compressors": [ZARR_COMPRESSOR]}}
+
+    write_mode = "w" if not save_fp.exists() else mode
+    arr.to_zarr(
+        save_fp,
+        zarr_format=2,
+        consolidated=True,
+        mode=write_mode,
+        encoding=encoding,
+    )
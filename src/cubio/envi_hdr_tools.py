@@ -1,106 +1,331 @@
 # Built-ins
+from contextlib import contextmanager
+from functools import lru_cache
+import math
+import mmap
 from pathlib import Path
 import re
 import textwrap
-from typing import Literal
+from typing import Iterator, Literal, TypedDict
+import warnings
+
+# Dependencies
+import numpy as np
+from affine import Affine  # type: ignore
+from rasterio.crs import CRS  # type: ignore
+
+# Header field patterns, compiled once at import. These are bytes patterns,
+# so they run directly on a memory map of the header.
+_BAND_NAMES_RE = re.compile(rb"band\s*names\s*=\s*{([\s\S]*?)}")
+_WAVELENGTH_RE = re.compile(rb"(?<=\n)wavelength\s*=\s*{([\s\S]*?)}")
+_BBL_RE = re.compile(rb"(?<=\n)bbl\s*=\s*{([\s\S]*?)}")
+_DESC_RE = re.compile(rb"description\s*=\s*{([\s\S]*?)}")
+# The shape fields rewritten together by `replace_shape_fields`.
+_SHAPE_FIELDS_RE = re.compile(rb"(samples|lines|bands)(\s*=\s*)\d+")
+
+# Text encoding of header files. ENVI headers are ASCII, of which this is a
+# superset.
+_HDR_ENCODING = "utf-8"
+
+
+@lru_cache(maxsize=None)
+def _int_field_re(field_name: str) -> re.Pattern[bytes]:
+    return re.compile(rb"(%s\s*=\s*\d+)" % re.escape(field_name.encode()))
+
+
+# Layout follows the headers written by the GDAL ENVI driver, with the cubio
+# specific fields (wavelength units, wavelength and bbl) appended.
+ENVI_HDR_TEMPLATE = """ENVI
+description = {{
+{description}}}
+samples = {samples}
+lines = {lines}
+bands = {bands}
+header offset = {header_offset}
+file type = ENVI Standard
+data type = {data_type}
+interleave = {interleave}
+byte order = 0
+{georeference}band names = {{
+{band_names}}}
+data ignore value = {nodata}
+wavelength units = {measurement_units}
+wavelength = {{{wavelengths}}}
+bbl = {{{bbl}}}
+"""
+
+
+class HdrFields(TypedDict):
+    description: str
+    wavelengths: list[float] | Literal["Wavelengths not found."]
+    bbl: list[int] | Literal["No BBL Found"]
+    band_names: list[str] | Literal["Band names not found."]
+
+
+@contextmanager
+def _map_hdr(hdr_fp: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """
+    Memory maps a header for reading, so it is searched in place and paged
+    in by the OS instead of being copied whole into a string.
+    """
+    with open(hdr_fp, "rb") as src:
+        try:
+            mm = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped.
+            yield b""
+            return
+        with mm:
+            yield mm
+
+
+def _search_hdr(
+    buf: mmap.mmap | bytes, pattern: re.Pattern[bytes]
+) -> bytes | None:
+    # Only the matched field is copied out of the map. It is left as bytes:
+    # text fields decode just this, numeric lists are parsed undecoded.
+    match = pattern.search(buf)
+    if not match:
+        return None
+    return match.group(1)
+
+
+def _parse_number_list(s: bytes, dtype: type[np.number]) -> list:
+    # An empty list (e.g. `bbl = { }`) would parse as a single -1 or 0.
+    if not s.strip():
+        return []
+    # Parsed in C by numpy. Malformed entries only warn there, so the warning
+    # is raised as the ValueError that a float()/int() loop would give.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        return np.fromstring(s, dtype=dtype, sep=",").tolist()
+
+
+def _band_names_from_buf(
+    buf: mmap.mmap | bytes,
+) -> list[str] | Literal["Band names not found."]:
+    result = _search_hdr(buf, _BAND_NAMES_RE)
+    if result is None:
+        return "Band names not found."
+    names = result.decode(_HDR_ENCODING)
+    return [name for i in names.split(",") if (name := i.strip())]
+
+
+def _wavelengths_from_buf(
+    buf: mmap.mmap | bytes,
+) -> list[float] | Literal["Wavelengths not found."]:
+    result = _search_hdr(buf, _WAVELENGTH_RE)
+    if result is None:
+        return "Wavelengths not found."
+    return _parse_number_list(result, np.float64)
+
+
+def _bbl_from_buf(
+    buf: mmap.mmap | bytes,
+) -> list[int] | Literal["No BBL Found"]:
+    result = _search_hdr(buf, _BBL_RE)
+    if result is None:
+        return "No BBL Found"
+    return _parse_number_list(result, np.int64)
+
+
+def _desc_from_buf(buf: mmap.mmap | bytes) -> str:
+    result = _search_hdr(buf, _DESC_RE)
+    if result is None:
+        raise ValueError("Invalid .HDR format: Cannot find description.")
+    return result.decode(_HDR_ENCODING)
 
 
 def extract_hdr_band_names(
     hdr_fp: str | Path,
 ) -> list[str] | Literal["Band names not found."]:
-    ptrn = re.compile(r"band\s*names\s*=\s*{([\s\S]*)}")
-    with open(hdr_fp) as src:
-        s = src.read()
-    match = re.search(ptrn, s)
-    if not match:
+    with _map_hdr(hdr_fp) as buf:
+        band_names = _band_names_from_buf(buf)
+    if band_names == "Band names not found.":
         raise ValueError("Invalid .HDR format: Cannot find band names.")
-    result = match.groups()[0][1:]
-    return [i.strip() for i in re.split(r"\s*,\s*\n?", result)]
+    return band_names
 
 
 def extract_hdr_wavelengths(
     hdr_fp: str | Path,
 ) -> list[float] | Literal["Wavelengths not found."]:
-    ptrn = re.compile(r"(?<=\n)wavelength\s*=\s*{([\s\S]*?)}")
-    with open(hdr_fp) as src:
-        s = src.read()
-    match = re.search(ptrn, s)
-    if not match:
-        return "Wavelengths not found."
-    result = match.groups()[0]
-    return [float(i.strip()) for i in re.split(r"\s*,\s*\n?", result)]
+    with _map_hdr(hdr_fp) as buf:
+        return _wavelengths_from_buf(buf)
 
 
 def extract_hdr_bbl(hdr_fp: str | Path) -> list[int] | Literal["No BBL Found"]:
-    ptrn = re.compile(r"(?<=\n)bbl\s*=\s*{([\s\S]*?)}")
-    with open(hdr_fp) as src:
-        s = src.read()
-    match = re.search(ptrn, s)
-    if not match:
-        return "No BBL Found"
-    result = match.groups()[0]
-    return [int(i.strip()) for i in re.split(r"\s*,\s*\n?", result)]
+    with _map_hdr(hdr_fp) as buf:
+        return _bbl_from_buf(buf)
 
 
 def extract_hdr_desc(hdr_fp: str | Path) -> str:
-    ptrn = re.compile(r"description\s*=\s*{([\s\S]*?)}")
-    with open(hdr_fp) as src:
-        s = src.read()
-    match = re.search(ptrn, s)
-    if not match:
-        raise ValueError("Invalid .HDR format: Cannot find description.")
-    result = match.groups()[0]
-    return result
+    with _map_hdr(hdr_fp) as buf:
+        return _desc_from_buf(buf)
+
+
+@lru_cache(maxsize=128)
+def _parse_hdr(hdr_fp: str, mtime_ns: int) -> HdrFields:
+    # `mtime_ns` is only part of the cache key, so an edited header is
+    # re-parsed rather than served stale.
+    with _map_hdr(hdr_fp) as buf:
+        return {
+            "description": _desc_from_buf(buf),
+            "wavelengths": _wavelengths_from_buf(buf),
+            "bbl": _bbl_from_buf(buf),
+            "band_names": _band_names_from_buf(buf),
+        }
+
+
+def read_hdr_fields(hdr_fp: str | Path) -> HdrFields:
+    """
+    Reads the description, wavelengths, bbl and band names of an ENVI header
+    in a single pass.
+
+    Parameters
+    ----------
+    hdr_fp: str | Path
+        Path to the .hdr file.
+
+    Notes
+    -----
+    Results are cached on the file path and modification time, so repeated
+    reads of the same header skip the file entirely. The returned lists are
+    shared with the cache and should not be modified in place. Missing fields
+    use the same sentinel strings as the `extract_hdr_*` functions.
+    """
+    hdr_fp = Path(hdr_fp)
+    return _parse_hdr(str(hdr_fp), hdr_fp.stat().st_mtime_ns)
+
+
+def envi_map_info(crs: CRS, transform: Affine) -> str:
+    """
+    Formats the ENVI `map info` field for a CRS and affine transform.
+
+    Parameters
+    ----------
+    crs: CRS
+        Coordinate reference system of the image.
+    transform: Affine
+        Affine transform of the upper-left pixel corner.
+
+    Notes
+    -----
+    Only geographic and UTM systems are named explicitly. Every other
+    projection (including ones the GDAL ENVI driver names, such as Mercator)
+    is written as "Arbitrary", and readers take it from the `coordinate
+    system string` field instead. Rotated transforms are written as pixel
+    sizes plus a `rotation` entry in degrees.
+    """
+    epsg = crs.to_epsg()
+    if crs.is_geographic:
+        proj_fields: list[str] = ["Geographic Lat/Lon"]
+        zone_fields: list[str] = []
+    elif epsg is not None and (
+        32601 <= epsg <= 32660 or 32701 <= epsg <= 32760
+    ):
+        proj_fields = ["UTM"]
+        hemisphere = "North" if epsg < 32700 else "South"
+        zone_fields = [str(epsg % 100), hemisphere]
+    else:
+        proj_fields = ["Arbitrary"]
+        zone_fields = []
+
+    a, b, c, d, e, f = transform[:6]
+    xsize = math.hypot(a, b)
+    ysize = math.hypot(d, e)
+    rotation = math.degrees((math.atan2(b, a) + math.atan2(d, -e)) / 2)
+
+    fields = [
+        *proj_fields,
+        "1",
+        "1",
+        *(f"{v:.15g}" for v in (c, f, xsize, ysize)),
+        *zone_fields,
+    ]
+    map_info = ", ".join(fields)
+    if crs.to_dict().get("datum") == "WGS84":
+        map_info += ",WGS-84"
+    if rotation:
+        map_info += f", rotation={rotation:.15g}"
+    return f"{{{map_info}}}"
 
 
 def replace_hdr_band_names(hdr_fp: str | Path, new_band_names: list[str]):
-    ptrn = re.compile(r"band\s*names\s*=\s*{([\s\S]*)}")
-    with open(hdr_fp) as src:
+    with open(hdr_fp, "rb") as src:
         s = src.read()
-    match = re.search(ptrn, s)
+    match = _BAND_NAMES_RE.search(s)
     if not match:
         raise ValueError("Invalid .HDR format: Cannot find band names.")
     result = match.groups()[0]
-    new_hdr_str = s.replace(result, ", ".join(new_band_names))
-    with open(hdr_fp, "w") as dst:
+    new_names = ", ".join(new_band_names).encode(_HDR_ENCODING)
+    new_hdr_str = s.replace(result, new_names)
+    with open(hdr_fp, "wb") as dst:
         dst.write(new_hdr_str)
 
 
 def replace_hdr_description(hdr_fp: str | Path, new_desc: str):
-    ptrn = re.compile(r"description\s*=\s*{([\s\S]*?)}")
-    with open(hdr_fp) as src:
+    with open(hdr_fp, "rb") as src:
         s = src.read()
-    match = re.search(ptrn, s)
+    match = _DESC_RE.search(s)
     if not match:
         raise ValueError("Invalid .HDR format: Cannot find description.")
     result = match.groups()[0]
-    new_hdr_str = s.replace(result, f"\n{textwrap.fill(new_desc, width=80)}")
-    with open(hdr_fp, "w") as dst:
+    new_desc_str = f"\n{textwrap.fill(new_desc, width=80)}"
+    new_hdr_str = s.replace(result, new_desc_str.encode(_HDR_ENCODING))
+    with open(hdr_fp, "wb") as dst:
         dst.write(new_hdr_str)
 
 
 def replace_integer_field(
     hdr_fp: str | Path, field_name: str, replace_value: int
 ) -> None:
-    ptrn = re.compile(
-        rf"({field_name}\s*=\s*\d+)"
-    )  # \nlines\s*=\s*\d\nbands\s*=\s*\d")
-    with open(hdr_fp) as src:
+    with open(hdr_fp, "rb") as src:
         s = src.read()
-    match = re.search(ptrn, s)
+    match = _int_field_re(field_name).search(s)
     if not match:
         raise ValueError(
             f"Invalid .HDR format: Cannot find integer field: {field_name}"
         )
     result = match.groups()[0]
-    new_hdr_str = s.replace(result, f"{field_name} = {replace_value}")
-    with open(hdr_fp, "w") as dst:
+    new_field = f"{field_name} = {replace_value}".encode(_HDR_ENCODING)
+    new_hdr_str = s.replace(result, new_field)
+    with open(hdr_fp, "wb") as dst:
+        dst.write(new_hdr_str)
+
+
+def _replace_integer_fields_bulk(
+    hdr_fp: str | Path, pattern: re.Pattern[bytes], fields: dict[str, int]
+) -> None:
+    """
+    Replaces integer fields of a header in one read, one substitution pass
+    and one write. `pattern` captures the field name and the `=` separator
+    of every field in `fields`, followed by the integer value.
+    """
+    with open(hdr_fp, "rb") as src:
+        s = src.read()
+    values = {k.encode(_HDR_ENCODING): v for k, v in fields.items()}
+    found: set[bytes] = set()
+
+    def _sub(match: re.Match[bytes]) -> bytes:
+        found.add(match.group(1))
+        value = str(values[match.group(1)]).encode(_HDR_ENCODING)
+        return match.group(1) + match.group(2) + value
+
+    new_hdr_str = pattern.sub(_sub, s)
+    for field_name, key in zip(fields, values):
+        if key not in found:
+            raise ValueError(
+                "Invalid .HDR format: Cannot find integer field:"
+                f" {field_name}"
+            )
+    with open(hdr_fp, "wb") as dst:
         dst.write(new_hdr_str)
 
 
 def replace_shape_fields(
     hdr_fp: Path | str, *, samples: int, lines: int, bands: int
 ):
-    replace_integer_field(hdr_fp, "samples", samples)
-    replace_integer_field(hdr_fp, "lines", lines)
-    replace_integer_field(hdr_fp, "bands", bands)
+    _replace_integer_fields_bulk(
+        hdr_fp,
+        _SHAPE_FIELDS_RE,
+        {"samples": samples, "lines": lines, "bands": bands},
+    )
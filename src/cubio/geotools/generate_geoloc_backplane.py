@@ -1,5 +1,9 @@
+# Built-Ins
+from functools import lru_cache
+
 # Dependencies
 import numpy as np
+from scipy.interpolate import RegularGridInterpolator
 from scipy.spatial import Delaunay
 import xarray as xr
 
@@ -7,6 +11,56 @@ import xarray as xr
 from .models.gcp_model import GCPGroup
 
 
+@lru_cache(maxsize=8)
+def _triangulate(
+    pix_bytes: bytes, dtype: str, npoints: int
+) -> tuple[Delaunay, np.ndarray]:
+    """
+    Triangulates the GCP pixel positions, cached on their raw bytes so that
+    repeated georeferencing with the same GCPs triangulates once.
+
+    Returns
+    -------
+    tuple[Delaunay, np.ndarray]
+        The triangulation, and its barycentric transforms as a (6, nsimplex)
+        array with one contiguous row per coefficient: T00, T01, T10, T11 of
+        the 2x2 matrix, then the two components of the offset.
+    """
+    pix = np.frombuffer(pix_bytes, dtype=dtype).reshape((npoints, 2))
+    tri = Delaunay(pix)
+    coefs = np.ascontiguousarray(tri.transform.reshape((-1, 6)).T)
+    coefs.setflags(write=False)
+    return tri, coefs
+
+
+def _regular_grid(
+    col_gcps: np.ndarray, row_gcps: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    Checks whether the GCPs form a full row/column lattice, with exactly one
+    GCP per (row, column) pair.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray] | None
+        The sorted unique rows and columns of the lattice, and the order
+        that sorts the GCPs row-major onto it, or None if the GCPs are not
+        on a lattice.
+    """
+    urows = np.unique(row_gcps)
+    ucols = np.unique(col_gcps)
+    if urows.size < 2 or ucols.size < 2:
+        return None
+    if urows.size * ucols.size != row_gcps.size:
+        return None
+    flat = np.searchsorted(urows, row_gcps) * ucols.size + np.searchsorted(
+        ucols, col_gcps
+    )
+    if np.unique(flat).size != flat.size:
+        return None
+    return urows, ucols, np.argsort(flat)
+
+
 def generate_latlong(
     col_gcps: np.ndarray,
     row_gcps: np.ndarray,
@@ -14,32 +68,82 @@ def generate_latlong(
     lat_gcps: np.ndarray,
     height: int,
     width: int,
+    fast_regular: bool = False,
 ) -> np.ndarray:
+    """
+    Interpolates a dense latitude/longitude backplane from a set of GCPs.
+
+    Parameters
+    ----------
+    col_gcps, row_gcps: np.ndarray
+        Pixel column and row of each GCP.
+    lon_gcps, lat_gcps: np.ndarray
+        Longitude and latitude of each GCP.
+    height, width: int
+        Size of the output backplane.
+    fast_regular: bool, default=False
+        If the GCPs form a full row/column lattice, interpolate bilinearly
+        on that lattice instead of triangulating the GCPs. Much faster, but
+        bilinear and triangle-wise linear interpolation differ slightly
+        inside each lattice cell.
+
+    Returns
+    -------
+    np.ndarray
+        (height, width, 2) array of latitude and longitude.
+    """
     # GCP arrays
     pix = np.column_stack([col_gcps, row_gcps])
     latlon = np.column_stack([lat_gcps, lon_gcps])
 
-    tri = Delaunay(pix)
+    # Full pixel grid, filled through a (height, width, 2) view so no
+    # meshgrid or stacking temporaries are created.
+    pts = np.empty((height * width, 2), dtype=np.float64)
+    grid = pts.reshape((height, width, 2))
+    grid[:, :, 0] = np.arange(width)
+    grid[:, :, 1] = np.arange(height)[:, None]
+
+    lattice = _regular_grid(col_gcps, row_gcps) if fast_regular else None
+    if lattice is not None:
+        urows, ucols, order = lattice
+        interp = RegularGridInterpolator(
+            (urows, ucols),
+            latlon[order].reshape((urows.size, ucols.size, 2)),
+            method="linear",
+            bounds_error=False,
+            fill_value=None,  # Extrapolated, as outside the triangulation
+        )
+        return interp(pts[:, ::-1]).reshape((height, width, 2))
 
-    # Full pixel grid
-    jj, ii = np.meshgrid(np.arange(height), np.arange(width), indexing="ij")
-    pts = np.column_stack([ii.ravel(), jj.ravel()])
+    tri, coefs = _triangulate(pix.tobytes(), pix.dtype.str, pix.shape[0])
 
     simplices = tri.find_simplex(pts)
-    T = tri.transform[simplices]
+    t00, t01, t10, t11, r0, r1 = (c[simplices] for c in coefs)
 
-    bary = np.einsum("ijk,ik->ij", T[:, :2, :], pts - T[:, 2])
-    bary = np.c_[bary, 1 - bary.sum(axis=1)]
+    # Barycentric coordinates, with the 2x2 matrix-vector products unrolled
+    # over whole columns rather than going through einsum.
+    d0 = pts[:, 0] - r0
+    d1 = pts[:, 1] - r1
+    b0 = t00 * d0 + t01 * d1
+    b1 = t10 * d0 + t11 * d1
+    b2 = 1 - b0 - b1
 
-    latlon_dense: np.ndarray = np.sum(
-        latlon[tri.simplices[simplices]] * bary[..., None], axis=1
-    )
+    # Weighted sum of the three vertex values, one output column at a time,
+    # so no (N, 3, 2) gather of the vertices is materialized.
+    verts = tri.simplices[simplices]
+    v0, v1, v2 = verts[:, 0], verts[:, 1], verts[:, 2]
+    latlon_dense = np.empty((height * width, 2), dtype=np.float64)
+    for k in range(2):
+        vals = latlon[:, k]
+        latlon_dense[:, k] = vals[v0] * b0 + vals[v1] * b1 + vals[v2] * b2
 
     return latlon_dense.reshape((height, width, 2))
 
 
 def latlong_from_gcp_group(
-    gcp_group: GCPGroup, base_image: np.ndarray | xr.DataArray
+    gcp_group: GCPGroup,
+    base_image: np.ndarray | xr.DataArray,
+    fast_regular: bool = False,
 ) -> np.ndarray:
     return generate_latlong(
         gcp_group.col_pixels,
@@ -48,4 +152,5 @@ def latlong_from_gcp_group(
         gcp_group.map_y,
         base_image.shape[0],
         base_image.shape[1],
+        fast_regular=fast_regular,
     )
@@ -37,16 +37,26 @@ def open_shapefile_as_shapely_polygon(
         raise ValueError("Invalid handle_geoms arg.")
 
 
+def _grid_axes(
+    lat_index: LabelLike, lon_index: LabelLike
+) -> tuple[np.ndarray, np.ndarray]:
+    # A (1, W) row of longitudes and a (H, 1) column of latitudes, which
+    # broadcast to the (H, W) grid without materializing a meshgrid.
+    lon_row = np.asarray(lon_index, dtype=np.float64)[np.newaxis, :]
+    lat_col = np.asarray(lat_index, dtype=np.float64)[:, np.newaxis]
+    return lon_row, lat_col
+
+
 def raster_from_polygon_list(
     lat_index: LabelLike, lon_index: LabelLike, polygon_list: list[Polygon]
 ) -> xr.DataArray:
     print("LIST PROCESSING")
-    lat_dense, lon_dense = np.meshgrid(lat_index, lon_index)
-    points = shapely.points(lon_dense, lat_dense)
+    lon_row, lat_col = _grid_axes(lat_index, lon_index)
     mask_list: list[xr.DataArray] = []
     for polygon in polygon_list:
+        shapely.prepare(polygon)
         poly_raster = xr.DataArray(
-            shapely.contains(polygon, points).T,
+            shapely.contains_xy(polygon, lon_row, lat_col),
             coords={"Latitude": lat_index, "Longitude": lon_index},
             dims=("Latitude", "Longitude"),
         )
@@ -60,7 +70,7 @@ def raster_from_polygon_list(
 
         print(poly_raster.coords)
     full_poly_raster = xr.DataArray(
-        np.zeros_like(lat_dense, dtype=bool),
+        np.zeros((len(lon_index), len(lat_index)), dtype=bool),
         coords={"Latitude": lat_index, "Longitude": lon_index},
         dims=("Longitude", "Latitude"),
     )
@@ -91,10 +101,11 @@ def raster_from_single_polygon(
     Because the lat/long grid must be uniformly spaced, only two 1-D arrays
     are required to create the entire lat/long grid.
     """
-    lat_dense, lon_dense = np.meshgrid(lat_index, lon_index)
-    points = shapely.points(lon_dense, lat_dense)
+    # Tested on the raw coordinates, without creating a Point per pixel.
+    lon_row, lat_col = _grid_axes(lat_index, lon_index)
+    shapely.prepare(polygon)
     poly_raster = xr.DataArray(
-        shapely.contains(polygon, points).T,
+        shapely.contains_xy(polygon, lon_row, lat_col),
         coords={"Latitude": lat_index, "Longitude": lon_index},
         dims=("Latitude", "Longitude"),
     )
@@ -40,12 +40,14 @@ def georeference_image(
     gcp_group = GCPGroup.from_gcps_file(gcps_file)
     if new_gcps_offset:
         gcp_group.adjust_offset(new_gcps_offset)
+    # np.asarray keeps a view of the (memory mapped) cube data, rather than
+    # copying it all into memory; bands are paged in as they are resampled.
     if apply_cropping:
-        offset_cube: np.ndarray = np.array(
+        offset_cube: np.ndarray = np.asarray(
             gcp_group.offset.crop_image(unref_cube.array)
         )
     else:
-        offset_cube = np.array(unref_cube.array)
+        offset_cube = np.asarray(unref_cube.array)
 
     # ---- Creating Lat/Long Backplane ----
     latlongarr = latlong_from_gcp_group(gcp_group, offset_cube)
@@ -127,7 +129,7 @@ def save_georeference(
     if new_description is not None:
         referenced_context["description"] = new_description
 
-    georef_context = CubeContext.from_builder(referenced_context)
+    georef_context = CubeContext._from_trusted_dict(referenced_context)
 
     if save_new_context:
         georef_context.write_json(save_fp.with_suffix(".json"))
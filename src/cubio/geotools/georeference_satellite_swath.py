@@ -1,8 +1,12 @@
 # Built-Ins
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import math
 from typing_extensions import Self
 
 # Dependencies
+import dask
+import dask.array as dsk_array
 import numpy as np
 from pyresample.geometry import AreaDefinition, SwathDefinition
 from pyresample import kd_tree
@@ -14,7 +18,7 @@ from .models import BoundingBoxModel
 from cubio.geotools.models import GeotransformModel, PointModel
 
 MOON_RADIUS = 1737400
-MOON_M_PER_DEG = np.pi * MOON_RADIUS / 180
+MOON_M_PER_DEG: float = math.pi * MOON_RADIUS / 180
 
 
 @dataclass
@@ -26,7 +30,7 @@ class ProjectionDefinition:
     crs_wkt_str: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PixelResolution:
     pix_per_deg: float
     deg_per_pix: float
@@ -34,8 +38,7 @@ class PixelResolution:
 
     @classmethod
     def from_array(cls, max_lat: float, min_lat: float, height: int) -> Self:
-        lat_height = max_lat - min_lat
-        dpp: float = lat_height / height  # Degrees per pixel
+        dpp = (max_lat - min_lat) / height  # Degrees per pixel
         return cls(
             pix_per_deg=1 / dpp,
             deg_per_pix=dpp,
@@ -43,16 +46,81 @@ class PixelResolution:
         )
 
 
+# Number of bands gathered together for each tile, which bounds the size of
+# the gathered temporary.
+_BAND_BLOCK = 16
+
+
+def _resample_tile(
+    swath: SwathDefinition,
+    tile_area: AreaDefinition,
+    radius: float,
+    satellite_data: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    # The swath and tile are the same for every band, so the KDTree and the
+    # neighbour lookup are done once and reused for each band.
+    valid_in, valid_out, index_array, _ = kd_tree.get_neighbour_info(
+        swath,
+        tile_area,
+        radius,
+        neighbours=1,
+        epsilon=0.5,
+    )
+    # Nearest neighbour gather done here rather than by
+    # get_sample_from_neighbour_info, which builds a full sized temporary
+    # per band: the source pixels are gathered by row and column straight
+    # into the output. Output pixels without a neighbour keep the NaN fill.
+    nvalid = np.count_nonzero(valid_in)
+    if nvalid == 0:  # Tile lies outside the swath.
+        return
+    found = index_array != nvalid
+    # The gather indices are kept as int32 whenever they fit: they are read
+    # once per band block, so this halves their memory traffic.
+    idx_dtype = np.int32 if valid_in.size < 2**31 else np.int64
+    dst_rows, dst_cols = (
+        i.astype(np.int32, copy=False)
+        for i in np.unravel_index(
+            np.flatnonzero(valid_out)[found], tile_area.shape
+        )
+    )
+    src_rows, src_cols = (
+        i.astype(idx_dtype, copy=False)
+        for i in np.unravel_index(
+            np.flatnonzero(valid_in)[index_array[found]],
+            satellite_data.shape[:2],
+        )
+    )
+    for b in range(0, out.shape[2], _BAND_BLOCK):
+        bands = slice(b, b + _BAND_BLOCK)
+        out[dst_rows, dst_cols, bands] = satellite_data[
+            src_rows, src_cols, bands
+        ]
+
+
 def georeference_satellite_swath(
     satellite_data: np.ndarray | xr.DataArray,
     longitude_backplane: np.ndarray | xr.DataArray,
     latitude_backplane: np.ndarray | xr.DataArray,
     proj: ProjectionDefinition,
     extent: BoundingBoxModel,
+    max_workers: int | None = None,
+    tile_size: int = 2048,
 ) -> tuple[np.ndarray, GeotransformModel]:
     # ---- Automatically detecting resolution ----
-    max_lat = float(latitude_backplane[0, :].max())
-    min_lat = float(latitude_backplane[-1, :].min())
+    # Reduced on the underlying array: xarray reductions add their own
+    # overhead, and dask-backed rows are computed in a single graph.
+    lat = (
+        latitude_backplane.data
+        if isinstance(latitude_backplane, xr.DataArray)
+        else latitude_backplane
+    )
+    if isinstance(lat, dsk_array.Array):
+        top_max, bottom_min = dask.compute(lat[0, :].max(), lat[-1, :].min())
+    else:
+        top_max, bottom_min = np.max(lat[0, :]), np.min(lat[-1, :])
+    max_lat = float(top_max)
+    min_lat = float(bottom_min)
     res = PixelResolution.from_array(
         max_lat=max_lat, min_lat=min_lat, height=satellite_data.shape[0]
     )
@@ -86,33 +154,45 @@ def georeference_satellite_swath(
             fill_value=np.nan,  # type: ignore
         )
     elif satellite_data.ndim == 3:
-        first_band_resamp = kd_tree.resample_nearest(
-            swath,
-            satellite_data[:, :, 0],
-            area,
-            res.m_per_pix * 3,
-            epsilon=0.5,  # type: ignore
-            fill_value=np.nan,  # type: ignore
+        nbands = satellite_data.shape[2]
+        out_dtype = (
+            np.float32 if satellite_data.dtype.itemsize <= 4 else np.float64
         )
-        if not isinstance(first_band_resamp, np.ndarray):
-            raise ValueError("Invalid first band resampling.")
-        resampled_data = np.empty(
-            (*first_band_resamp.shape, satellite_data.shape[2])
+        resampled_data = np.full(
+            (*area.shape, nbands), np.nan, dtype=out_dtype
         )
-        resampled_data[:, :, 0] = first_band_resamp
-        for band in tqdm(
-            range(1, satellite_data.shape[2]),
-            desc="Resampling bands...",
-            total=satellite_data.shape[2] - 1,
-        ):
-            resampled_data[:, :, band] = kd_tree.resample_nearest(
+        # Resampled tile by tile, so the neighbour index arrays only ever
+        # cover one tile of the target area. Nearest neighbour needs no
+        # overlap between tiles.
+        tiles = [
+            (slice(r, r + tile_size), slice(c, c + tile_size))
+            for r in range(0, area.shape[0], tile_size)
+            for c in range(0, area.shape[1], tile_size)
+        ]
+        # Converted once, rather than once per tile, so the tiles gather
+        # from a plain array.
+        source = np.asarray(satellite_data)
+
+        def _tile(tile: tuple[slice, slice]) -> None:
+            rows, cols = tile
+            _resample_tile(
                 swath,
-                satellite_data[:, :, band],
-                area,
+                area[rows, cols],
                 res.m_per_pix * 3,
-                epsilon=0.5,  # type: ignore
-                fill_value=np.nan,  # type: ignore
+                source,
+                resampled_data[rows, cols, :],
             )
+
+        # Tiles write to disjoint parts of the output, and the neighbour
+        # lookup and numpy gathers release the GIL, so the tiles are
+        # resampled on the thread pool.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in tqdm(
+                executor.map(_tile, tiles),
+                total=len(tiles),
+                desc="Resampling tiles...",
+            ):
+                pass
     else:
         raise ValueError(
             "Satellite data has an invalid number of dimensions:"
@@ -177,4 +177,7 @@ def resample_regular_cubedata(
     resamp_cubedata = CubeData(src_cubedata.name, src_cubedata.fmt)
     resamp_cubedata.array = resamp
 
-    return CubeContext.from_builder(resamp_builder), resamp_cubedata
+    return (
+        CubeContext._from_trusted_dict(resamp_builder),
+        resamp_cubedata,
+    )
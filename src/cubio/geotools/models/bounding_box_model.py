@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
 import fiona  # type: ignore
 from shapely.geometry import Polygon, mapping  # type: ignore
@@ -30,16 +31,23 @@ def todms(
     else:
         hemi = "E" if dd >= 0 else "W"
 
-    total_seconds = round(abs(dd) * 3600, precision)
-    degrees = int(total_seconds // 3600)
-    remainder = total_seconds - degrees * 3600
-    minutes = int(remainder // 60)
-    seconds = remainder - minutes * 60
+    # Split in integer units of the last printed seconds digit, so there is
+    # no float remainder to print as e.g. 59.99 or 60.
+    scale = 10**precision
+    total = round(abs(dd) * 3600 * scale)
+    degrees, remainder = divmod(total, 3600 * scale)
+    minutes, seconds = divmod(remainder, 60 * scale)
+    if precision > 0:
+        whole, frac = divmod(seconds, scale)
+        sec_str = f"{whole}.{frac:0{precision}d}"
+    else:
+        sec_str = str(seconds)
 
-    return f"{degrees}°{minutes}'{seconds:.{precision}f}\"{hemi}"
+    return f"{degrees}°{minutes}'{sec_str}\"{hemi}"
 
 
-class Point(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Point:
     x: float
     y: float
 
@@ -94,12 +102,15 @@ class BoundingBoxModel(BaseModel):
 
     @property
     def shapely_polygon(self) -> Polygon:
+        # Corners straight from the fields, in the same order as the corner
+        # properties (top left, top right, bottom right, bottom left), so no
+        # intermediate `Point` models are built.
         return Polygon(
             [
-                self.top_left.as_tuple(),
-                self.top_right.as_tuple(),
-                self.bottom_right.as_tuple(),
-                self.bottom_left.as_tuple(),
+                (self.left, self.top),
+                (self.right, self.top),
+                (self.right, self.bottom),
+                (self.left, self.bottom),
             ]
         )
 
@@ -129,19 +140,9 @@ class BoundingBoxModel(BaseModel):
         self, mode: Literal["TopLeft", "BottomLeft"] = "BottomLeft"
     ) -> list[float]:
         if mode == "BottomLeft":
-            return [
-                self.bottom_left.x,
-                self.bottom_left.y,
-                self.top_right.x,
-                self.top_right.y,
-            ]
+            return [self.left, self.bottom, self.right, self.top]
         elif mode == "TopLeft":
-            return [
-                self.top_left.x,
-                self.top_left.y,
-                self.bottom_right.x,
-                self.bottom_right.y,
-            ]
+            return [self.left, self.top, self.right, self.bottom]
 
     def as_dict(self) -> BBoxDict:
         bbox_dict: BBoxDict = {
@@ -187,14 +188,15 @@ def to_shapefile(
     else:
         save = Path(dst_fp).with_suffix(".shp")
         print(f"Writing to single shapefile: {save}")
+        # All boxes go to the driver as one batch of records.
         with fiona.open(save, "w", **fiona_config) as c:
-            for i in bbox_list:
-                c.write(
-                    {
-                        "geometry": mapping(i.shapely_polygon),
-                        "properties": {"name": i.name},
-                    }
-                )
+            c.writerecords(
+                {
+                    "geometry": mapping(i.shapely_polygon),
+                    "properties": {"name": i.name},
+                }
+                for i in bbox_list
+            )
 
 
 def to_csv(bbox: list[BoundingBoxModel], dst_fp: Path | str) -> None:
@@ -1,14 +1,19 @@
 # Built-Ins
 import re
 from pathlib import Path
+from typing import Any
 from typing_extensions import Self
 from uuid import UUID, uuid4
 
 # Dependencies
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import xarray as xr
 
+# Header block of a GCP text file, and the "key: value" lines within it.
+_GCP_HDR_RE = re.compile(r"Source for Target Image:[\s\S]*?ID")
+_GCP_HDR_FIELD_RE = re.compile(r"(.+?):(.*)")
+
 
 class GroundControlPoint(BaseModel):
     pixel_row: float = Field(
@@ -64,51 +69,48 @@ class ImageOffset(BaseModel):
 class GCPGroup(BaseModel):
     offset: ImageOffset
     gcp_list: list[GroundControlPoint]
+    # (ngcp, 4) array of the pixel row, pixel column, map x and map y of every
+    # GCP, built on first use. It is dropped by `add_gcp` and by assigning
+    # `gcp_list`, but not by changes made inside the list or its GCPs.
+    _gcp_array: np.ndarray | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "gcp_list":
+            self._gcp_array = None
 
     @classmethod
     def from_txt(cls, file_path: Path | str, headerrows: int = 7) -> Self:
         data = np.loadtxt(
             file_path, dtype="<U36", skiprows=headerrows, delimiter=","
         )
-        good_cols = []
-        for i in range(data.shape[1]):
-            if np.all(data[:, i] == " "):
-                continue
-            good_cols.append(i)
-
-        data = data[:, np.array(good_cols)]
-
-        gcp_list: list[GroundControlPoint] = []
-        for idx in range(data.shape[0]):
-            row = data[idx, :]
-            gcp = GroundControlPoint(
-                pixel_row=row[1],
-                pixel_column=row[2],
-                map_x=row[3],
-                map_y=row[4],
-            )
-            gcp_list.append(gcp)
+        # Columns that are blank in every row are separators, not data.
+        good_cols = np.any(data != " ", axis=0)
+        coords = data[:, good_cols][:, 1:5].astype(np.float64)
+        coords.flags.writeable = False
+
+        # Built from already parsed floats, which validate in pydantic's core
+        # without any string conversion. (This is faster than
+        # `model_construct`, whose Python-side default handling dominates.)
+        gcp_list = [
+            GroundControlPoint(pixel_row=r, pixel_column=c, map_x=x, map_y=y)
+            for r, c, x, y in coords.tolist()
+        ]
 
-        hdr_pattern = re.compile(r"Source for Target Image:[\s\S]*?ID")
         with open(file_path, "r") as f:
             file_content = f.read()
-            test = re.search(hdr_pattern, file_content)
+            test = _GCP_HDR_RE.search(file_content)
         if test is None:
             raise ValueError(f"Invalid File Header: {file_content}")
         header = file_content[slice(*test.span())]
-        header_lines = header.split("\n")
 
-        search_list = [
-            re.search(r"([\s\S]*?):([\s\S]*)", i) for i in header_lines[:-1]
-        ]
+        # Every complete line of the header, i.e. all but the last one.
         header_dict: dict[str, int] = {}
-        for item in search_list:
-            if item is not None:
-                g = item.groups()
-                try:
-                    header_dict[g[0]] = int(g[1])
-                except ValueError:
-                    continue
+        for item in _GCP_HDR_FIELD_RE.finditer(header.rpartition("\n")[0]):
+            try:
+                header_dict[item.group(1)] = int(item.group(2))
+            except ValueError:
+                continue
 
         offset = ImageOffset(
             height=header_dict["Target Image Height"],
@@ -117,10 +119,12 @@ class GCPGroup(BaseModel):
             column=header_dict["Column Offset"],
         )
 
-        return cls(
+        group = cls(
             offset=offset,
             gcp_list=gcp_list,
         )
+        group._gcp_array = coords
+        return group
 
     @classmethod
     def from_gcps_file(cls, fp: Path | str) -> Self:
@@ -132,24 +136,51 @@ class GCPGroup(BaseModel):
     def ngcp(self) -> int:
         return len(self.gcp_list)
 
+    @property
+    def gcp_array(self) -> np.ndarray:
+        """
+        Read-only (ngcp, 4) array of the GCPs, with columns pixel row, pixel
+        column, map x and map y.
+
+        Notes
+        -----
+        The array is cached. GCPs must be added with `add_gcp`, or the list
+        replaced by assigning `gcp_list`: editing the list or its GCPs in
+        place leaves the array out of date.
+        """
+        arr = self._gcp_array
+        if arr is None:
+            arr = np.fromiter(
+                (
+                    (gcp.pixel_row, gcp.pixel_column, gcp.map_x, gcp.map_y)
+                    for gcp in self.gcp_list
+                ),
+                dtype=np.dtype((np.float64, 4)),
+                count=len(self.gcp_list),
+            )
+            arr.flags.writeable = False
+            self._gcp_array = arr
+        return arr
+
     @property
     def row_pixels(self) -> np.ndarray:
-        return np.array([gcp.pixel_row for gcp in self.gcp_list])
+        return self.gcp_array[:, 0]
 
     @property
     def col_pixels(self) -> np.ndarray:
-        return np.array([gcp.pixel_column for gcp in self.gcp_list])
+        return self.gcp_array[:, 1]
 
     @property
     def map_x(self) -> np.ndarray:
-        return np.array([gcp.map_x for gcp in self.gcp_list])
+        return self.gcp_array[:, 2]
 
     @property
     def map_y(self) -> np.ndarray:
-        return np.array([gcp.map_y for gcp in self.gcp_list])
+        return self.gcp_array[:, 3]
 
     def add_gcp(self, gcp: GroundControlPoint):
         self.gcp_list.append(gcp)
+        self._gcp_array = None
 
     def write_json(self, fp: Path | str) -> None:
         with open(Path(fp).with_suffix(".gcps"), "w") as f:
@@ -173,14 +204,23 @@ class GCPGroup(BaseModel):
     def adjust_offset(self, new_offset: ImageOffset):
         row_diff = self.offset.row - new_offset.row
         col_diff = self.offset.column - new_offset.column
-        new_gcp_list: list[GroundControlPoint] = []
-        for gcp in self.gcp_list:
-            new_gcp = GroundControlPoint(
-                pixel_row=gcp.pixel_row + row_diff,
-                pixel_column=gcp.pixel_column + col_diff,
-                map_x=gcp.map_x,
-                map_y=gcp.map_y,
+        # Shifted copies rather than new, revalidated GCPs: the map
+        # coordinates and ids carry over as they are. The GCPs themselves are
+        # not modified, since `__add__` may share them with another group.
+        new_gcp_list = [
+            gcp.model_copy(
+                update={
+                    "pixel_row": gcp.pixel_row + row_diff,
+                    "pixel_column": gcp.pixel_column + col_diff,
+                }
             )
-            new_gcp_list.append(new_gcp)
+            for gcp in self.gcp_list
+        ]
+        arr = self._gcp_array
         self.offset = new_offset
         self.gcp_list = new_gcp_list
+        if arr is not None:
+            # Same shift on the cached array, in one numpy operation.
+            arr = arr + np.array([row_diff, col_diff, 0, 0], dtype=np.float64)
+            arr.flags.writeable = False
+            self._gcp_array = arr
@@ -1,5 +1,8 @@
 # Built-ins
-from typing import Literal
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Literal, NamedTuple
 from typing_extensions import Self
 
 # Dependencies
@@ -15,16 +18,44 @@ class GeographicBoundsError(Exception):
         super().__init__(message)
 
 
-class PointModel(BaseModel):
-    """Representation of a ordered pair"""
+@dataclass(slots=True, frozen=True)
+class PointModel:
+    """
+    Representation of a ordered pair
+
+    Notes
+    -----
+    A plain dataclass rather than a pydantic model, since one is built for
+    every `pixel_to_map` / `map_to_pixel` call. The coordinates are converted
+    with `float()` on creation, so invalid values raise and numpy scalars are
+    stored as Python floats. Pydantic serializes it as the `upperleft` field
+    of `GeotransformModel`.
+    """
 
     x: float
     y: float
 
+    def __post_init__(self) -> None:
+        # Frozen, so the converted values are set through object.
+        object.__setattr__(self, "x", float(self.x))
+        object.__setattr__(self, "y", float(self.y))
+
     def astuple(self):
         return (self.x, self.y)
 
 
+class _InverseTerms(NamedTuple):
+    """Transform-only terms of the `map_to_pixel` inverse."""
+
+    scaler: float
+    x_offset: float
+    x_ycoef: float
+    x_rot: float
+    y_offset: float
+    y_xcoef: float
+    y_rot: float
+
+
 class GeotransformModel(BaseModel):
     """
     Object representing an affine geotransform matrix.
@@ -49,6 +80,40 @@ class GeotransformModel(BaseModel):
     yres: float
     col_rotation: float
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self.__dict__.pop("_inverse_terms", None)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        # Updated fields bypass `__setattr__`, so the copied terms may be
+        # stale.
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("_inverse_terms", None)
+        return copied
+
+    @cached_property
+    def _inverse_terms(self) -> _InverseTerms:
+        """
+        Terms of the inverse transform that do not depend on the point,
+        dropped whenever a field is reassigned or updated by `model_copy`.
+        Each term is computed exactly as it appears in the inverse, so using
+        them gives the same result bit for bit.
+        """
+        return _InverseTerms(
+            scaler=(self.xres * self.yres)
+            - (self.col_rotation * self.row_rotation),
+            x_offset=self.upperleft.x * self.yres,
+            x_ycoef=(self.row_rotation * self.yres) / self.xres,
+            x_rot=self.row_rotation * self.upperleft.y,
+            y_offset=self.upperleft.y * self.xres,
+            y_xcoef=(self.col_rotation * self.xres) / self.yres,
+            y_rot=self.col_rotation * self.upperleft.x,
+        )
+
     @classmethod
     def null(cls):
         return cls(
@@ -162,21 +227,13 @@ class GeotransformModel(BaseModel):
 
     def map_to_pixel(self, xmap: float, ymap: float) -> PointModel:
         """Convert a map coordinate point to a pixel coordinate point."""
-        _scaler = (self.xres * self.yres) - (
-            self.col_rotation * self.row_rotation
-        )
+        inv = self._inverse_terms
         xpixel = (
-            (self.yres * xmap)
-            - (self.upperleft.x * self.yres)
-            - ((self.row_rotation * self.yres) / self.xres) * ymap
-            + (self.row_rotation * self.upperleft.y)
-        ) / _scaler
+            (self.yres * xmap) - inv.x_offset - inv.x_ycoef * ymap + inv.x_rot
+        ) / inv.scaler
         ypixel = (
-            (self.xres * ymap)
-            - (self.upperleft.y * self.xres)
-            - ((self.col_rotation * self.xres) / self.yres) * xmap
-            + (self.col_rotation * self.upperleft.x)
-        ) / _scaler
+            (self.xres * ymap) - inv.y_offset - inv.y_xcoef * xmap + inv.y_rot
+        ) / inv.scaler
 
         if xpixel < 0:
             raise GeographicBoundsError(
@@ -188,6 +245,77 @@ class GeotransformModel(BaseModel):
             )
         return PointModel(x=xpixel, y=ypixel)
 
+    def pixel_to_map_array(
+        self,
+        xpixel: np.ndarray,
+        ypixel: np.ndarray,
+        convention: Literal["globe", "hemi"] = "hemi",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of `pixel_to_map`, converting many pixel coordinates
+        to map coordinates at once.
+
+        Parameters
+        ----------
+        xpixel: np.ndarray
+            Pixel x coordinates (columns).
+        ypixel: np.ndarray
+            Pixel y coordinates (rows), broadcastable against `xpixel`.
+        convention: {"globe", "hemi"}, default="hemi"
+            Longitude convention of the returned x coordinates.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Tuple of (map x-coordinates, map y-coordinates).
+        """
+        xpixel = np.asarray(xpixel, dtype=np.float64)
+        ypixel = np.asarray(ypixel, dtype=np.float64)
+        xmap = (
+            self.upperleft.x + xpixel * self.xres + ypixel * self.row_rotation
+        )
+        ymap = (
+            self.upperleft.y + ypixel * self.yres + xpixel * self.col_rotation
+        )
+
+        if convention == "globe":
+            xmap = np.where(xmap < 0, xmap + 360, xmap)
+        return xmap, ymap
+
+    def map_to_pixel_array(
+        self, xmap: np.ndarray, ymap: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of `map_to_pixel`, converting many map coordinates to
+        pixel coordinates at once.
+
+        Parameters
+        ----------
+        xmap: np.ndarray
+            Map x coordinates.
+        ymap: np.ndarray
+            Map y coordinates, broadcastable against `xmap`.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Tuple of (pixel x-coordinates, pixel y-coordinates).
+
+        Notes
+        -----
+        Unlike `map_to_pixel`, points beyond the left or top bounds are not
+        an error: they are returned as negative pixel coordinates. This is
+        the exact inverse of `pixel_to_map_array`, including for rotated
+        transforms, where `map_to_pixel` is not.
+        """
+        dx = np.asarray(xmap, dtype=np.float64) - self.upperleft.x
+        dy = np.asarray(ymap, dtype=np.float64) - self.upperleft.y
+        # Inverse of the 2x2 linear part of the transform.
+        det = self.xres * self.yres - self.row_rotation * self.col_rotation
+        xpixel = (self.yres * dx - self.row_rotation * dy) / det
+        ypixel = (self.xres * dy - self.col_rotation * dx) / det
+        return xpixel, ypixel
+
     def generate_coords(
         self, *, width: int, height: int
     ) -> tuple[np.ndarray, np.ndarray]:
@@ -207,10 +335,10 @@ class GeotransformModel(BaseModel):
         tuple[np.ndarray, np.ndarray]
             Tuple of (x-coordinates, y-coordinates).
         """
-        xcoords = np.empty(width, dtype=np.float32)
-        ycoords = np.empty(height, dtype=np.float32)
-        for nx in range(width):
-            xcoords[nx] = self.pixel_to_map(xpixel=nx, ypixel=0).x
-        for ny in range(height):
-            ycoords[ny] = self.pixel_to_map(xpixel=0, ypixel=ny).y
-        return xcoords, ycoords
+        # First row and first column of `pixel_to_map`, so the rotation terms
+        # drop out. Computed in float64 and stored as float32, as before.
+        nx = np.arange(width, dtype=np.float64)
+        ny = np.arange(height, dtype=np.float64)
+        xcoords = self.upperleft.x + nx * self.xres
+        ycoords = self.upperleft.y + ny * self.yres
+        return xcoords.astype(np.float32), ycoords.astype(np.float32)
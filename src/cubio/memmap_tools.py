@@ -0,0 +1,36 @@
+"""
+#### `memmap_tools`
+Tools for the memory maps that back on-disk image cubes.
+"""
+
+# Built-ins
+import mmap
+
+# Dependencies
+import numpy as np
+
+# Local imports
+from cubio.types import MemmapAccess
+
+
+# madvise hint for each kind of memmap access.
+_MADVISE_FLAGS: dict[MemmapAccess, str] = {
+    "sequential": "MADV_SEQUENTIAL",
+    "random": "MADV_RANDOM",
+    "willneed": "MADV_WILLNEED",
+}
+
+
+def advise_memmap(arr: np.memmap, access: MemmapAccess) -> None:
+    """
+    Tells the OS how a memmap will be read, so it can read ahead (or not)
+    accordingly. Does nothing where madvise is not available (e.g. Windows).
+    """
+    buf = getattr(arr, "_mmap", None)
+    flag = getattr(mmap, _MADVISE_FLAGS[access], None)
+    if buf is None or flag is None or not hasattr(buf, "madvise"):
+        return
+    try:
+        buf.madvise(flag)
+    except OSError:
+        pass
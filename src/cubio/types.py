@@ -120,6 +120,9 @@ image_suffix_priority: dict[ImageSuffix, int] = {
     ".tif": 6,
     ".tiff": 7,
 }
+image_suffixes_by_priority: list[ImageSuffix] = sorted(
+    image_suffix_priority, key=lambda suff: image_suffix_priority[suff]
+)
 
 
 def is_valid_image_suffix(value: str) -> TypeGuard[ImageSuffix]:
@@ -138,6 +141,8 @@ TrimDirection: TypeAlias = Literal[
     "NoTrim", "SpatialTrim", "All", "x", "y", "z"
 ]
 
+MemmapAccess: TypeAlias = Literal["sequential", "random", "willneed"]
+
 
 class BBoxDict(TypedDict):
     top: float
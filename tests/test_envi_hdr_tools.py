@@ -0,0 +1,13 @@
+# Built-Ins
+from pathlib import Path
+
+# Local Imports
+from cubio.envi_hdr_tools import extract_hdr_bbl, extract_hdr_wavelengths
+
+
+def test_empty_number_lists(tmp_path: Path):
+    hdr = tmp_path / "cube.hdr"
+    hdr.write_text("ENVI\nwavelength = {}\nbbl = { }\n")
+
+    assert extract_hdr_wavelengths(hdr) == []
+    assert extract_hdr_bbl(hdr) == []
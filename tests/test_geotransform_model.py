@@ -0,0 +1,16 @@
+# Dependencies
+import numpy as np
+
+# Local Imports
+from cubio.geotools.models import GeotransformModel
+
+
+def test_map_to_pixel_array_round_trip_with_rotation():
+    gtrans = GeotransformModel.fromgdal((100, 2, 0.5, 50, 0.25, -3))
+    cols, rows = np.meshgrid(np.arange(0, 200, 25.0), np.arange(0, 100, 7.0))
+
+    xmap, ymap = gtrans.pixel_to_map_array(cols, rows)
+    xpix, ypix = gtrans.map_to_pixel_array(xmap, ymap)
+
+    np.testing.assert_allclose(xpix, cols, atol=1e-9)
+    np.testing.assert_allclose(ypix, rows, atol=1e-9)
@@ -0,0 +1,29 @@
+# Dependencies
+import numpy as np
+
+# Local Imports
+from cubio.cube_data import CubeData
+from cubio.geotools.models import GeotransformModel
+
+
+def _masked_cube() -> CubeData:
+    # BIP cube of 3 rows, 4 columns and 5 bands, with one nodata pixel.
+    data = np.arange(3 * 4 * 5, dtype=np.float32).reshape(3, 4, 5)
+    data[1, 2, :] = -999
+    cube = CubeData("test", "BIP", nodata=-999)
+    cube.array = data
+    return cube
+
+
+def test_isel_masked_after_geotransform():
+    cube = _masked_cube()
+    cube.add_nodata_mask()
+    cube.geotransform = GeotransformModel.fromgdal((10, 1, 0, 20, 0, -1))
+
+    band = cube.isel_masked(ZAxis=1)
+
+    assert band.dims == ("Latitude", "Longitude")
+    assert band.shape == (3, 4)
+    assert np.isnan(band.values[1, 2])
+    assert np.count_nonzero(np.isnan(band.values)) == 1
+